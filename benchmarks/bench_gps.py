@@ -0,0 +1,16 @@
+from geometry import GPSPosition, GPSPositions
+import numpy as np
+
+
+def test_sub(benchmark, n, rng):
+    home = GPSPosition(51.459387, -2.791393)
+    gps = GPSPositions(np.column_stack([
+        home.latitude + rng.random(n) * 0.01,
+        home.longitude + rng.random(n) * 0.01
+    ]))
+    benchmark(lambda: home - gps)
+
+
+def test_scalar_sub(benchmark):
+    a, b = GPSPosition(51.459387, -2.791393), GPSPosition(51.46, -2.79)
+    benchmark(a.__sub__, b)
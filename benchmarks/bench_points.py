@@ -0,0 +1,11 @@
+from geometry import Points
+
+
+def test_dot(benchmark, n, rng):
+    a, b = Points(rng.random((n, 3))), Points(rng.random((n, 3)))
+    benchmark(a.dot, b)
+
+
+def test_cross(benchmark, n, rng):
+    a, b = Points(rng.random((n, 3))), Points(rng.random((n, 3)))
+    benchmark(a.cross, b)
@@ -0,0 +1,26 @@
+from geometry import Points, Quaternions
+import numpy as np
+
+
+def random_quaternions(rng, n):
+    return Quaternions.from_euler(Points(rng.random((n, 3)) * 2 * np.pi))
+
+
+def test_mul(benchmark, n, rng):
+    a, b = random_quaternions(rng, n), random_quaternions(rng, n)
+    benchmark(a.__mul__, b)
+
+
+def test_transform_point(benchmark, n, rng):
+    q, p = random_quaternions(rng, n), Points(rng.random((n, 3)))
+    benchmark(q.transform_point, p)
+
+
+def test_from_euler(benchmark, n, rng):
+    p = Points(rng.random((n, 3)) * 2 * np.pi)
+    benchmark(Quaternions.from_euler, p)
+
+
+def test_diff(benchmark, n, rng):
+    q = Quaternions.from_euler(Points(np.cumsum(rng.random((n, 3)) * 0.01, axis=0)))
+    benchmark(q.diff, np.full(n, 0.01))
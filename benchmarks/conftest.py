@@ -0,0 +1,25 @@
+"""
+Shared fixtures for the benchmark suite. The suite needs pytest-benchmark and is
+not collected by a plain pytest run, see the benchmarks section of README.md.
+
+Sizes run from 1e2 up to GEOMETRY_BENCH_MAX_SIZE samples (default 1e6, set it to
+1e7 for the full sweep, which needs a few GB of memory).
+"""
+import os
+import numpy as np
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+
+MAX_SIZE = int(float(os.environ.get("GEOMETRY_BENCH_MAX_SIZE", "1e6")))
+SIZES = [n for n in [10 ** e for e in range(2, 8)] if n <= MAX_SIZE]
+
+
+@pytest.fixture(params=SIZES, ids=lambda n: "n={:.0e}".format(n))
+def n(request):
+    return request.param
+
+
+@pytest.fixture
+def rng():
+    return np.random.default_rng(0)
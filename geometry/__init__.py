@@ -11,8 +11,13 @@ this program. If not, see <http://www.gnu.org/licenses/>.
 """
 from .point import Point, cross_product, dot_product, cos_angle_between, scalar_projection,vector_projection
 from .points import Points
-from .gps import GPSPosition
+from .gps import GPSPosition, GPSPositions
 from .coordinate_frame import Coord
+from .coordinate_frames import Coords
 from .quaternion import Quaternion
 from .quaternions import Quaternions
 from .transformation import Transformation
+from .transformations import Transformations
+from .trajectory import Trajectory
+from .spatial import SpatialIndex
+from .integration import AttitudeIntegrator
@@ -0,0 +1,167 @@
+"""
+This program is free software: you can redistribute it and/or modify it under
+the terms of the GNU General Public License as published by the Free Software
+Foundation, either version 3 of the License, or (at your option) any later
+version.
+This program is distributed in the hope that it will be useful, but WITHOUT
+ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+FOR A PARTICULAR PURPOSE. See the GNU General Public License for more details.
+You should have received a copy of the GNU General Public License along with
+this program. If not, see <http://www.gnu.org/licenses/>.
+
+Runs a geometry pipeline over many logs in a process pool.
+
+A log is either the path of a bundle saved with geometry.storage.save, which the
+worker memory maps itself, or a dict of arrays, which is copied once into shared
+memory rather than being pickled to the worker (or, before python 3.8, written to a
+temporary bundle that the worker memory maps). The worker saves the pipeline
+output as a bundle in out_dir and only the path comes back, so the results can be
+opened with geometry.storage.load as memory maps.
+"""
+from geometry.gps import GPSPosition, GPSPositions
+from geometry.points import Points
+from geometry.quaternions import Quaternions
+from geometry.transformation import Transformation
+from geometry.trajectory import _forward_dt
+from geometry import storage
+from concurrent.futures import ProcessPoolExecutor, FIRST_COMPLETED, wait
+from typing import Callable, Dict, List, Union
+import os
+import tempfile
+import numpy as np
+
+try:
+    from multiprocessing import shared_memory
+except ImportError:  # python < 3.8
+    shared_memory = None
+
+
+class GeometryPipeline(object):
+    def __init__(self, home: GPSPosition = None, transform: Transformation = None,
+                 gps: str = 'gps', att: str = 'att', t: str = 't'):
+        """The standard log preprocessing: GPS to NED Points from home, optionally moved by
+        a Transformation, and body rates from the attitude.
+
+        Args:
+            home (GPSPosition, optional): defaults to the first GPS sample of each log, with
+                its altitude if the log has one. A given home needs an altitude for logs
+                with altitudes.
+            transform (Transformation, optional): applied to the positions and attitudes
+            gps, att, t (str): the names of the gps, attitude and time fields in the log
+        """
+        self.home = home
+        self.transform = transform
+        self.gps = gps
+        self.att = att
+        self.t = t
+
+    def __call__(self, log: Dict[str, np.ndarray]) -> Dict[str, Union[np.ndarray, Points, Quaternions]]:
+        gps = GPSPositions(storage._field_data(log[self.gps]))
+        home = self.home if self.home is not None else gps[0]
+        pos = gps.ned_from(home)
+        att = Quaternions(storage._field_data(log[self.att]))
+        if self.transform is not None:
+            pos = self.transform.point(pos)
+            att = self.transform.quat(att)
+        t = storage._field_data(log[self.t])
+        return dict(t=t, pos=pos, att=att, body_rates=att.body_diff(_forward_dt(t)))
+
+
+def _share(log: Dict[str, np.ndarray]):
+    """copy the arrays of a log into shared memory, returns the blocks and their descriptions"""
+    blocks, desc = [], {}
+    for name, arr in log.items():
+        arr = np.ascontiguousarray(storage._field_data(arr))
+        block = shared_memory.SharedMemory(create=True, size=max(arr.nbytes, 1))
+        np.ndarray(arr.shape, arr.dtype, buffer=block.buf)[...] = arr
+        blocks.append(block)
+        desc[name] = (block.name, arr.shape, arr.dtype.str)
+    return blocks, desc
+
+
+def _run(pipeline: Callable, log: Union[str, dict], out_path: str) -> str:
+    blocks = []
+    try:
+        if isinstance(log, str):
+            data = storage.load(log)
+        else:
+            data = {}
+            for name, (block_name, shape, dtype) in log.items():
+                block = shared_memory.SharedMemory(name=block_name)
+                blocks.append(block)
+                data[name] = np.ndarray(shape, np.dtype(dtype), buffer=block.buf)
+        storage.save(out_path, **pipeline(data))
+        del data
+    finally:
+        for block in blocks:
+            block.close()
+    return out_path
+
+
+def run_batch(logs: List[Union[str, Dict[str, np.ndarray]]], pipeline: Callable, out_dir: str,
+              workers: int = None) -> List[str]:
+    """run pipeline over each log in a process pool.
+
+    Args:
+        logs (List[Union[str, Dict[str, np.ndarray]]]): bundle paths or dicts of arrays
+        pipeline (Callable): picklable callable taking a dict of arrays and returning a dict
+            of equal length series to save, such as GeometryPipeline
+        out_dir (str): where the output bundles are written
+        workers (int, optional): number of processes, defaults to the number of cpus
+
+    Returns:
+        List[str]: the output bundle paths, in the order of logs
+    """
+    workers = workers or os.cpu_count() or 1
+    os.makedirs(out_dir, exist_ok=True)
+
+    def out_path(i, log):
+        # the index keeps the names unique when logs in different folders share a name
+        name = '{:06d}'.format(i)
+        if isinstance(log, str):
+            name += '_' + os.path.splitext(os.path.basename(log))[0]
+        return os.path.join(out_dir, name + '.npy')
+
+    results = [None] * len(logs)
+    shared = {}
+    tmp = tempfile.TemporaryDirectory() if shared_memory is None else None
+    try:
+        with ProcessPoolExecutor(workers) as pool:
+            pending = set()
+            for i, log in enumerate(logs):
+                # bound the number of logs held in shared memory at once
+                if len(pending) >= 2 * workers:
+                    done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    _collect(done, shared, results)
+                if isinstance(log, str):
+                    future = pool.submit(_run, pipeline, log, out_path(i, log))
+                elif tmp is not None:
+                    path = os.path.join(tmp.name, '{:06d}.npy'.format(i))
+                    storage.save(path, **log)
+                    future = pool.submit(_run, pipeline, path, out_path(i, log))
+                else:
+                    blocks, desc = _share(log)
+                    future = pool.submit(_run, pipeline, desc, out_path(i, log))
+                    shared[future] = blocks
+                future.index = i
+                pending.add(future)
+            _collect(wait(pending)[0], shared, results)
+    finally:
+        # the pool has shut down, so no worker still has the blocks of a failed batch open
+        _release([block for blocks in shared.values() for block in blocks])
+        if tmp is not None:
+            tmp.cleanup()
+    return results
+
+
+def _release(blocks):
+    for block in blocks:
+        block.close()
+        block.unlink()
+
+
+def _collect(done, shared, results):
+    for future in done:
+        _release(shared.pop(future, []))
+    for future in done:
+        results[future.index] = future.result()
@@ -13,7 +13,6 @@ this program. If not, see <http://www.gnu.org/licenses/>.
 from . import Point, cross_product
 from typing import List
 import numpy as np
-import pandas as pd
 
 # TODO look at scipy.spatial.transform.Rotation
 
@@ -82,6 +81,8 @@ class Coord(object):
         return Coord(self.origin + point, self.x_axis, self.y_axis, self.z_axis)
 
     def get_plot_df(self, length=10):
+        import pandas as pd
+
         def make_ax(ax: Point, colour: str):
             return [
                 list(self.origin) + [colour],
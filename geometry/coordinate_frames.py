@@ -0,0 +1,123 @@
+"""
+This program is free software: you can redistribute it and/or modify it under
+the terms of the GNU General Public License as published by the Free Software
+Foundation, either version 3 of the License, or (at your option) any later
+version.
+This program is distributed in the hope that it will be useful, but WITHOUT
+ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+FOR A PARTICULAR PURPOSE. See the GNU General Public License for more details.
+You should have received a copy of the GNU General Public License along with
+this program. If not, see <http://www.gnu.org/licenses/>.
+"""
+
+from . import Point, Points, Coord
+from typing import List, Union
+import numpy as np
+
+
+class Coords(object):
+    def __init__(self, origin: Points, axes: np.ndarray):
+        """
+        Args:
+            origin (Points): the n origins
+            axes (np.ndarray): n * 3 * 3 array of unit axes, axes[:, 0] are the x axes,
+                axes[:, 1] the y axes and axes[:, 2] the z axes.
+        """
+        self.origin = origin
+        self.axes = axes
+
+    @property
+    def count(self):
+        return self.axes.shape[0]
+
+    @property
+    def x_axis(self):
+        return Points(self.axes[:, 0, :])
+
+    @property
+    def y_axis(self):
+        return Points(self.axes[:, 1, :])
+
+    @property
+    def z_axis(self):
+        return Points(self.axes[:, 2, :])
+
+    def __getitem__(self, i) -> Coord:
+        return Coord(
+            Point(*self.origin.data[i]),
+            Point(*self.axes[i, 0]),
+            Point(*self.axes[i, 1]),
+            Point(*self.axes[i, 2])
+        )
+
+    @staticmethod
+    def from_axes(origin: Points, x_axis: Points, y_axis: Points, z_axis: Points):
+        axes = np.stack([x_axis.data, y_axis.data, z_axis.data], axis=1)
+        axes /= np.linalg.norm(axes, axis=2)[:, :, np.newaxis]
+        return Coords(origin, axes)
+
+    @staticmethod
+    def from_nothing(count: int):
+        return Coords(
+            Points(np.zeros((count, 3))),
+            np.tile(np.identity(3), (count, 1, 1))
+        )
+
+    @staticmethod
+    def from_coord(coord: Coord, count: int):
+        return Coords(
+            Points.from_point(coord.origin, count),
+            np.tile(coord.rotation_matrix, (count, 1, 1))
+        )
+
+    @staticmethod
+    def from_coords(coords: List[Coord]):
+        return Coords(
+            Points(np.array([list(coord.origin) for coord in coords])),
+            np.array([coord.rotation_matrix for coord in coords])
+        )
+
+    @staticmethod
+    def from_xy(origin: Points, x_axis: Points, y_axis: Points):
+        return Coords.from_axes(origin, x_axis, y_axis, x_axis.cross(y_axis))
+
+    @staticmethod
+    def from_yz(origin: Points, y_axis: Points, z_axis: Points):
+        return Coords.from_axes(origin, y_axis.cross(z_axis), y_axis, z_axis)
+
+    @staticmethod
+    def from_zx(origin: Points, z_axis: Points, x_axis: Points):
+        return Coords.from_axes(origin, x_axis, z_axis.cross(x_axis), z_axis)
+
+    @property
+    def rotation_matrix(self) -> np.ndarray:
+        return self.axes
+
+    @property
+    def inverse_rotation_matrix(self) -> np.ndarray:
+        return np.swapaxes(self.axes, 1, 2)
+
+    def rotate(self, rotation_matrix: np.ndarray):
+        """rotate the axes by a 3 * 3 rotation matrix or an n * 3 * 3 stack of them"""
+        return Coords(
+            self.origin,
+            np.matmul(self.axes, np.swapaxes(np.asarray(rotation_matrix), -1, -2))
+        )
+
+    def euler_rotation(self, angles: Union[Point, Points]):
+        return self.rotate(angles.to_rotation_matrix())
+
+    def translate(self, point: Union[Point, Points]):
+        return Coords(self.origin + point, self.axes)
+
+    def get_plot_df(self, length=10):
+        import pandas as pd
+
+        # for each coord and axis: origin, origin + axis * length, origin
+        lines = np.repeat(self.origin.data[:, np.newaxis, np.newaxis, :], 3, axis=1)
+        lines = np.repeat(lines, 3, axis=2)
+        lines[:, :, 1, :] += self.axes * length
+
+        df = pd.DataFrame(lines.reshape(-1, 3), columns=list('xyz'))
+        df['c'] = np.tile(np.repeat(['red', 'blue', 'green'], 3), self.count)
+        return df
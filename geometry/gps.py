@@ -11,7 +11,8 @@ this program. If not, see <http://www.gnu.org/licenses/>.
 """
 import math
 from geometry.point import Point
-import unittest
+from geometry.points import Points, _as_float
+import numpy as np
 from typing import List
 
 
@@ -20,15 +21,21 @@ class GPSPosition(object):
     approx_earth_radius = 6378100
     LOCATION_SCALING_FACTOR = math.radians(approx_earth_radius)
 
-    def __init__(self, latitude: float, longitude: float):
+    def __init__(self, latitude: float, longitude: float, altitude: float = None):
+        """altitude (m) is optional, without it offsets have no down component"""
         self.latitude = latitude
         self.longitude = longitude
+        self.altitude = altitude
 
     def to_tuple(self):
-        return (self.latitude, self.longitude)
+        if self.altitude is None:
+            return (self.latitude, self.longitude)
+        return (self.latitude, self.longitude, self.altitude)
 
     def to_dict(self):
-        return dict(latitude=self.latitude, longitude=self.longitude)
+        if self.altitude is None:
+            return dict(latitude=self.latitude, longitude=self.longitude)
+        return dict(latitude=self.latitude, longitude=self.longitude, altitude=self.altitude)
 
     def __str__(self):
         return 'lat: ' + str(self._latitude) + ', long: ' + str(self._longitude)
@@ -46,14 +53,103 @@ class GPSPosition(object):
         ]
 
     def __sub__(self, other) -> Point:
+        if not isinstance(other, GPSPosition):
+            return NotImplemented
         return Point(
             (other.latitude - self.latitude) *
             GPSPosition.LOCATION_SCALING_FACTOR,
             -(other.longitude - self.longitude) *
             GPSPosition.LOCATION_SCALING_FACTOR * self._longitude_scale(),
-            0
+            0 if self.altitude is None or other.altitude is None else self.altitude - other.altitude
         )
-        
+
+
+class GPSPositions(object):
+    def __init__(self, data: np.ndarray):
+        """
+        Args:
+            data (np.ndarray): n * 2 array of latitude, longitude in degrees,
+                or n * 3 array of latitude, longitude, altitude (m)
+        """
+        self.data = data
+
+    @property
+    def latitude(self):
+        return self.data[:, 0]
+
+    @property
+    def longitude(self):
+        return self.data[:, 1]
+
+    @property
+    def altitude(self):
+        if not self.has_altitude:
+            return np.zeros(self.count)
+        return self.data[:, 2]
+
+    @property
+    def count(self):
+        return self.data.shape[0]
+
+    @property
+    def has_altitude(self):
+        return self.data.shape[1] >= 3
+
+    def __getitem__(self, i) -> GPSPosition:
+        return GPSPosition(*self.data[i, :3])
+
+    @staticmethod
+    def from_pandas(df):
+        return GPSPositions(np.array(df))
+
+    @staticmethod
+    def from_gps_positions(positions: List[GPSPosition]):
+        return GPSPositions(np.array([pos.to_tuple() for pos in positions]))
+
+    def _longitude_scale(self):
+        return np.maximum(np.cos(np.radians(self.latitude)), 0.01)
+
+    def ned_from(self, home: GPSPosition, home_altitude: float = None) -> Points:
+        """NED offsets of every position from home, same as home - GPSPosition for each row.
+        The down component is only non zero if altitude data is present, in which case the
+        home altitude is home_altitude or else home.altitude. A ValueError is raised if
+        neither is given, rather than returning absolute heights as down."""
+        if home_altitude is None:
+            home_altitude = home.altitude
+        if self.has_altitude and home_altitude is None:
+            raise ValueError("the positions have altitudes but home does not")
+        out = np.empty((self.count, 3), dtype=_as_float(self.data).dtype)
+        np.subtract(self.latitude, home.latitude, out=out[:, 0])
+        out[:, 0] *= GPSPosition.LOCATION_SCALING_FACTOR
+        np.subtract(home.longitude, self.longitude, out=out[:, 1])
+        out[:, 1] *= GPSPosition.LOCATION_SCALING_FACTOR
+        out[:, 1] *= home._longitude_scale()
+        if not self.has_altitude:
+            out[:, 2] = 0
+        else:
+            np.subtract(home_altitude, self.data[:, 2], out=out[:, 2])
+        return Points(out)
+
+    def __rsub__(self, other) -> Points:
+        if isinstance(other, GPSPosition):
+            return self.ned_from(other)
+        else:
+            return NotImplemented
+
+    def __sub__(self, other) -> Points:
+        """row wise offsets of other from self, using the longitude scale of self"""
+        if isinstance(other, GPSPositions):
+            if self.has_altitude != other.has_altitude:
+                raise ValueError("only one of the positions has altitudes")
+            return Points(np.column_stack([
+                (other.latitude - self.latitude) *
+                GPSPosition.LOCATION_SCALING_FACTOR,
+                -(other.longitude - self.longitude) *
+                GPSPosition.LOCATION_SCALING_FACTOR * self._longitude_scale(),
+                self.altitude - other.altitude
+            ]))
+        else:
+            return NotImplemented
 
 
 '''
@@ -0,0 +1,130 @@
+"""
+This program is free software: you can redistribute it and/or modify it under
+the terms of the GNU General Public License as published by the Free Software
+Foundation, either version 3 of the License, or (at your option) any later
+version.
+This program is distributed in the hope that it will be useful, but WITHOUT
+ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+FOR A PARTICULAR PURPOSE. See the GNU General Public License for more details.
+You should have received a copy of the GNU General Public License along with
+this program. If not, see <http://www.gnu.org/licenses/>.
+
+Attitude integration from rate Points.
+
+Rate sample i applies from sample i to sample i + 1, so integrating the output of
+Quaternions.body_diff (or diff with frame='world') from the first attitude gives
+back the original Quaternions. The increments for every sample are computed at
+once and chained with Quaternions.cumprod, so there is no per sample Python loop.
+"""
+from geometry.quaternion import Quaternion
+from geometry.points import Points, _as_float
+from geometry.quaternions import Quaternions, _mul, _exp, _normalize
+import numpy as np
+
+
+SCHEMES = ['exp', 'rk4', 'coning']
+FRAMES = ['body', 'world']
+
+
+def _pure(v: np.ndarray) -> np.ndarray:
+    out = np.zeros(v.shape[:-1] + (4,), dtype=v.dtype)
+    out[..., 1:] = v
+    return out
+
+
+class AttitudeIntegrator(object):
+    def __init__(self, q0: Quaternion = None, scheme: str = 'exp', frame: str = 'body',
+                 renormalize: bool = True, executor=None):
+        """Integrates chunks of rates to attitudes, carrying the state between chunks.
+
+        Args:
+            q0 (Quaternion, optional): the attitude at the first sample, defaults to no rotation
+            scheme (str): how each increment is made from the rates:
+                'exp': the exponential map of the rate over dt, exact for constant rates
+                'rk4': fourth order Runge Kutta with the rate varying linearly to the next sample
+                'coning': the exponential map with the two sample coning correction, for rates
+                    that are delta angles over dt, as most IMUs report
+            frame (str): 'body' for body frame rates (body_diff), 'world' for world frame rates (diff)
+            renormalize (bool): normalise the partial products on every pass of the prefix
+                product and the carried state on every chunk
+            executor (ChunkExecutor, optional): passed to Quaternions.cumprod
+        """
+        if scheme not in SCHEMES:
+            raise ValueError("unknown integration scheme {}".format(scheme))
+        if frame not in FRAMES:
+            raise ValueError("unknown rate frame {}".format(frame))
+        self.scheme = scheme
+        self.frame = frame
+        self.renormalize = renormalize
+        self.executor = executor
+        self.q = np.array(list(q0) if q0 is not None else [1.0, 0.0, 0.0, 0.0])
+        self._rate = None
+        self._dt = None
+        self._alpha = np.zeros(3)
+
+    @property
+    def attitude(self) -> Quaternion:
+        """the attitude at the last sample integrated, q0 before the first chunk"""
+        return Quaternion(*self.q)
+
+    def _increments(self, w: np.ndarray, dt: np.ndarray) -> np.ndarray:
+        """the rotations from sample j to j + 1 for the rates w, len(w) - 1 of them"""
+        h = dt[:-1, np.newaxis]
+        if self.scheme == 'exp':
+            return _exp(w[:-1] * (h / 2))
+        elif self.scheme == 'coning':
+            alpha = w[:-1] * h
+            prev = np.vstack([self._alpha.astype(alpha.dtype)[np.newaxis, :], alpha[:-1]])
+            # the sign of the correction follows the order the increments are composed in
+            sign = 1 if self.frame == 'body' else -1
+            if len(alpha) > 0:
+                self._alpha = alpha[-1]
+            return _exp((alpha + sign * np.cross(prev, alpha) / 12) / 2)
+        else:
+            def f(y, omega):
+                pure = _pure(omega)
+                return (_mul(y, pure) if self.frame == 'body' else _mul(pure, y)) / 2
+
+            mid = (w[:-1] + w[1:]) / 2
+            y0 = np.zeros(w[:-1].shape[:-1] + (4,), dtype=w.dtype)
+            y0[:, 0] = 1
+            k1 = f(y0, w[:-1])
+            k2 = f(y0 + k1 * (h / 2), mid)
+            k3 = f(y0 + k2 * (h / 2), mid)
+            k4 = f(y0 + k3 * h, w[1:])
+            return _normalize(y0 + (k1 + 2 * k2 + 2 * k3 + k4) * (h / 6))
+
+    def __call__(self, rates: Points, dt) -> Quaternions:
+        """the attitudes at each sample of rates. The last rate of a chunk is applied when
+        the next chunk arrives, as rk4 needs the rate that follows it.
+
+        Args:
+            rates (Points): rates in rad/s, in the frame given to the constructor
+            dt (Union[float, np.ndarray]): the time from each sample to the next
+        """
+        w = _as_float(rates.data)
+        dt = np.broadcast_to(_as_float(dt, w.dtype), (len(w),))
+        if len(w) == 0:
+            return Quaternions(np.empty((0, 4), dtype=w.dtype))
+
+        q = self.q.astype(w.dtype)
+        if self._rate is not None:
+            w = np.vstack([self._rate.astype(w.dtype), w])
+            dt = np.concatenate([self._dt.astype(w.dtype), dt])
+        steps = Quaternions(self._increments(w, dt)).cumprod(
+            self.frame == 'body', normalize=self.renormalize, executor=self.executor).data
+        out = _mul(q, steps) if self.frame == 'body' else _mul(steps, q)
+        if self._rate is None:
+            out = np.vstack([q[np.newaxis, :], out])
+        if self.renormalize:
+            _normalize(out)
+
+        self.q = out[-1].copy()
+        self._rate, self._dt = w[-1:].copy(), dt[-1:].copy()
+        return Quaternions(out)
+
+    @staticmethod
+    def integrate(rates: Points, dt, q0: Quaternion = None, scheme: str = 'exp',
+                  frame: str = 'body', renormalize: bool = True, executor=None) -> Quaternions:
+        """the attitudes at each sample of rates in one go, see AttitudeIntegrator"""
+        return AttitudeIntegrator(q0, scheme, frame, renormalize, executor)(rates, dt)
@@ -0,0 +1,136 @@
+"""
+Pairwise comparisons between every row of a (n*3) and every row of b (m*3).
+
+Results are built from tiles of rows of a, so the temporaries stay within about
+TILE_BYTES however long the inputs are. By default the full n*m matrix is returned.
+With k only the k best matches for each row of a are kept, returned as
+(values, indices), both n*k. With threshold only the pairs that pass are kept,
+returned as (rows, cols, values) like SpatialIndex.query_radius, so the full
+matrix is never held.
+"""
+from typing import Callable
+import numpy as np
+
+
+TILE_BYTES = 2 ** 26
+# a tolerance on the magnitude below which a vector has no direction, as point.raisezero
+ZERO_TOLERANCE = 0.000001
+
+
+def _tile_rows(m: int, itemsize: int, tile: int = None) -> int:
+    """rows of a per tile, leaving room for a few m wide temporaries per row"""
+    return tile or max(1, TILE_BYTES // (4 * max(m, 1) * itemsize))
+
+
+def _collect(n: int, m: int, kernel: Callable[[int, int], np.ndarray], dtype, k: int = None,
+             largest: bool = False, select: Callable[[np.ndarray], np.ndarray] = None, tile: int = None):
+    """call kernel(start, stop) for each tile of rows and gather the full matrix, the k smallest
+    (largest) per row or the pairs chosen by select"""
+    rows = _tile_rows(m, np.dtype(dtype).itemsize, tile)
+    tiles = [(start, min(start + rows, n)) for start in range(0, n, rows)]
+
+    if k is not None:
+        k = min(k, m)
+        values = np.empty((n, k), dtype=dtype)
+        indices = np.empty((n, k), dtype=np.int64)
+        for start, stop in tiles:
+            t = kernel(start, stop)
+            key = -t if largest else t
+            part = np.argpartition(key, k - 1, axis=1)[:, :k] if k < m else \
+                np.broadcast_to(np.arange(m), key.shape)
+            order = np.argsort(np.take_along_axis(key, part, 1), axis=1, kind='stable')
+            indices[start:stop] = np.take_along_axis(part, order, 1)
+            values[start:stop] = np.take_along_axis(t, indices[start:stop], 1)
+        return values, indices
+    elif select is not None:
+        found = [(np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int64), np.empty(0, dtype=dtype))]
+        for start, stop in tiles:
+            t = kernel(start, stop)
+            r, c = np.nonzero(select(t))
+            found.append((r + start, c, t[r, c]))
+        return tuple(np.concatenate(parts) for parts in zip(*found))
+    else:
+        out = np.empty((n, m), dtype=dtype)
+        for start, stop in tiles:
+            out[start:stop] = kernel(start, stop)
+        return out
+
+
+def _units(data: np.ndarray) -> np.ndarray:
+    with np.errstate(invalid='ignore', divide='ignore'):
+        return data / np.sqrt(np.einsum('ij,ij->i', data, data))[:, np.newaxis]
+
+
+def distances(a: np.ndarray, b: np.ndarray, k: int = None, threshold: float = None, tile: int = None):
+    """euclidean distances, k nearest or the pairs closer than threshold. The components are
+    differenced directly rather than expanding |a - b|**2, so coincident points give 0."""
+    dtype = np.result_type(a, b)
+
+    def kernel(start, stop):
+        d2 = np.zeros((stop - start, len(b)), dtype=dtype)
+        for i in range(3):
+            diff = a[start:stop, i, np.newaxis] - b[np.newaxis, :, i]
+            diff *= diff
+            d2 += diff
+        return np.sqrt(d2, out=d2)
+
+    return _collect(len(a), len(b), kernel, dtype, k, False,
+                    None if threshold is None else (lambda t: t <= threshold), tile)
+
+
+def cosines(a: np.ndarray, b: np.ndarray, k: int = None, threshold: float = None, tile: int = None):
+    """cosines of the angles between, the k largest or the pairs above threshold. Zero
+    vectors give nan."""
+    dtype = np.result_type(a, b)
+    au, bu = _units(a), _units(b)
+
+    def kernel(start, stop):
+        return np.clip(au[start:stop] @ bu.T, -1, 1)
+
+    return _collect(len(a), len(b), kernel, dtype, k, True,
+                    None if threshold is None else (lambda t: t >= threshold), tile)
+
+
+def angles(a: np.ndarray, b: np.ndarray, k: int = None, threshold: float = None, tile: int = None):
+    """angles between in radians, the k smallest or the pairs below threshold. Zero vectors give nan."""
+    dtype = np.result_type(a, b)
+    au, bu = _units(a), _units(b)
+
+    def kernel(start, stop):
+        return np.arccos(np.clip(au[start:stop] @ bu.T, -1, 1))
+
+    return _collect(len(a), len(b), kernel, dtype, k, False,
+                    None if threshold is None else (lambda t: t <= threshold), tile)
+
+
+def _mask(n, m, kernel, sparse, tile):
+    if not sparse:
+        return _collect(n, m, kernel, bool, tile=tile)
+    rows, cols, _ = _collect(n, m, kernel, bool, select=lambda t: t, tile=tile)
+    return rows, cols
+
+
+def parallel(a: np.ndarray, b: np.ndarray, tolerance: float = 0.000001, sparse: bool = False,
+             tile: int = None):
+    """mask of the pairs that are parallel or anti parallel as point.is_parallel, False for
+    zero vectors. sparse returns the (rows, cols) of the True pairs instead."""
+    au, bu = _units(a), _units(b)
+
+    def kernel(start, stop):
+        with np.errstate(invalid='ignore'):
+            return np.abs(np.abs(au[start:stop] @ bu.T) - 1) < tolerance
+
+    return _mask(len(a), len(b), kernel, sparse, tile)
+
+
+def perpendicular(a: np.ndarray, b: np.ndarray, tolerance: float = 0.000001, sparse: bool = False,
+                  tile: int = None):
+    """mask of the pairs whose dot product is within tolerance of zero as point.is_perpendicular,
+    False for zero vectors. sparse returns the (rows, cols) of the True pairs instead."""
+    a_ok = np.sqrt(np.einsum('ij,ij->i', a, a)) >= ZERO_TOLERANCE
+    b_ok = np.sqrt(np.einsum('ij,ij->i', b, b)) >= ZERO_TOLERANCE
+
+    def kernel(start, stop):
+        return (np.abs(a[start:stop] @ b.T) < tolerance) & a_ok[start:stop, np.newaxis] & b_ok
+
+    return _mask(len(a), len(b), kernel, sparse, tile)
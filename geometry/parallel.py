@@ -0,0 +1,102 @@
+"""
+This program is free software: you can redistribute it and/or modify it under
+the terms of the GNU General Public License as published by the Free Software
+Foundation, either version 3 of the License, or (at your option) any later
+version.
+This program is distributed in the hope that it will be useful, but WITHOUT
+ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+FOR A PARTICULAR PURPOSE. See the GNU General Public License for more details.
+You should have received a copy of the GNU General Public License along with
+this program. If not, see <http://www.gnu.org/licenses/>.
+"""
+from geometry.point import Point
+from geometry.points import Points, _as_float
+from geometry.quaternions import Quaternions, _rotate
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, List, Tuple, Union
+import os
+import numpy as np
+
+
+class ChunkExecutor(object):
+    def __init__(self, workers: int = None, min_chunk: int = 65536):
+        """Runs the composite Points / Quaternions kernels on contiguous chunks of rows in a
+        thread pool. numpy releases the GIL inside its loops, so the chunks run on separate
+        cores. Every row is computed by the same code as the serial methods, so the results
+        are bit identical to them.
+
+        Args:
+            workers (int, optional): number of threads, defaults to the number of cpus
+            min_chunk (int): arrays are not split into chunks smaller than this
+        """
+        self.workers = workers or os.cpu_count() or 1
+        self.min_chunk = min_chunk
+        self._pool = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.shutdown()
+
+    def shutdown(self):
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
+
+    def ranges(self, count: int) -> List[Tuple[int, int]]:
+        """(start, stop) row ranges to split count rows into"""
+        nchunks = int(max(1, min(self.workers, count // self.min_chunk)))
+        bounds = np.linspace(0, count, nchunks + 1).astype(int)
+        return list(zip(bounds[:-1], bounds[1:]))
+
+    def map(self, func: Callable[[int, int], object], count: int) -> list:
+        """call func(start, stop) for each chunk of count rows, in parallel if there is more
+        than one chunk. Returns the results in order."""
+        ranges = self.ranges(count)
+        if len(ranges) == 1:
+            return [func(*ranges[0])]
+        if self._pool is None:
+            self._pool = ThreadPoolExecutor(self.workers)
+        return list(self._pool.map(lambda r: func(*r), ranges))
+
+    def transform_point(self, quats: Quaternions, point: Union[Point, Points]) -> Points:
+        """Quaternions.transform_point split over the workers"""
+        if isinstance(point, Point):
+            point = Points(np.array([list(point)], dtype=quats.dtype))
+        out = np.empty((max(quats.count, point.count), 3), dtype=np.result_type(quats.data, point.data))
+
+        def run(start, stop):
+            _rotate(
+                quats.data[start:stop] if quats.count > 1 else quats.data,
+                point.data[start:stop] if point.count > 1 else point.data,
+                out[start:stop]
+            )
+        self.map(run, len(out))
+        return Points(out)
+
+    def from_axis_angle(self, angles: Points, factor: float = 0.5) -> Quaternions:
+        """Quaternions.from_axis_angle split over the workers"""
+        out = np.empty((angles.count, 4), dtype=_as_float(angles.data).dtype)
+
+        def run(start, stop):
+            out[start:stop] = Quaternions.from_axis_angle(
+                Points(angles.data[start:stop]), factor).data
+        self.map(run, angles.count)
+        return Quaternions(out)
+
+    def _rates(self, quats: Quaternions, dt: np.ndarray, body: bool) -> Points:
+        out = np.empty((quats.count, 3), dtype=quats.dtype)
+
+        def run(start, stop):
+            out[start:stop] = quats._diff_rates(dt, body, start, stop).data
+        self.map(run, quats.count)
+        return Points(out)
+
+    def diff(self, quats: Quaternions, dt: np.ndarray) -> Points:
+        """Quaternions.diff split over the workers"""
+        return self._rates(quats, dt, False)
+
+    def body_diff(self, quats: Quaternions, dt: np.ndarray) -> Points:
+        """Quaternions.body_diff split over the workers"""
+        return self._rates(quats, dt, True)
@@ -17,6 +17,8 @@ from typing import List, Union, Dict
 
 
 class Point(object):
+    __slots__ = ['x', 'y', 'z']
+
     def __init__(self, x, y, z):
         self.x = x
         self.y = y
@@ -52,11 +54,7 @@ class Point(object):
 
     def __add__(self, other):
         if isinstance(other, Point):
-            return Point(
-                x=self.x + other.x,
-                y=self.y + other.y,
-                z=self.z + other.z
-            )
+            return Point(self.x + other.x, self.y + other.y, self.z + other.z)
         elif isinstance(other, Number):
             return Point(
                 x=self.x + other,
@@ -68,11 +66,7 @@ class Point(object):
 
     def __sub__(self, other):
         if isinstance(other, Point):
-            return Point(
-                x=self.x - other.x,
-                y=self.y - other.y,
-                z=self.z - other.z
-            )
+            return Point(self.x - other.x, self.y - other.y, self.z - other.z)
         elif isinstance(other, Number):
             return Point(
                 x=self.x - other,
@@ -80,7 +74,7 @@ class Point(object):
                 z=self.z - other
             )
         else:
-            return NotImplementedError
+            return NotImplemented
 
     def __eq__(self, other):
         if isinstance(other, Point):
@@ -93,9 +87,9 @@ class Point(object):
 
     def __mul__(self, other):
         if isinstance(other, Point):
-            return Point(x=other.x * self.x, y=other.y * self.y, z=other.z * self.z)
-        elif isinstance(other, Number):
-            return Point(x=other * self.x, y=other * self.y, z=other * self.z)
+            return Point(other.x * self.x, other.y * self.y, other.z * self.z)
+        elif isinstance(other, (float, int, Number)):
+            return Point(other * self.x, other * self.y, other * self.z)
         else:
             return NotImplemented
 
@@ -108,7 +102,7 @@ class Point(object):
     def __truediv__(self, other):
         if isinstance(other, Point):
             return Point(self.x / other.x, self.y / other.y, self.z / other.z)
-        elif isinstance(other, Number):
+        elif isinstance(other, (float, int, Number)):
             return Point(self.x / other, self.y / other, self.z / other)
         else:
             return NotImplemented
@@ -126,7 +120,7 @@ class Point(object):
             return NotImplemented
 
     def __neg__(self):
-        return -1 * self
+        return Point(-self.x, -self.y, -self.z)
 
     def scale(self, value):
         return self.__mul__(value / self.__abs__())
@@ -182,11 +176,19 @@ class Point(object):
         ]
 
 
+def _batched(*points) -> bool:
+    """True if any of points is not a Point, the batched versions in geometry.points handle those"""
+    return not all(isinstance(p, Point) for p in points)
+
+
 def dot_product(p1: Point, p2: Point):
     return p1.x * p2.x + p1.y * p2.y + p1.z * p2.z
 
 
 def cos_angle_between(p1: Point, p2: Point):
+    if _batched(p1, p2):
+        from geometry import points
+        return points.cos_angle_between(p1, p2)
     raisezero([p1, p2])
     return dot_product(p1.unit(), p2.unit())
 
@@ -200,6 +202,9 @@ def cross_product(p1: Point, p2: Point) -> Point:
 
 
 def scalar_projection(from_vec: Point, to_vec: Point):
+    if _batched(from_vec, to_vec):
+        from geometry import points
+        return points.scalar_projection(from_vec, to_vec)
     try:
         return cos_angle_between(from_vec, to_vec) * abs(from_vec)
     except ValueError:
@@ -207,12 +212,18 @@ def scalar_projection(from_vec: Point, to_vec: Point):
 
 
 def vector_projection(from_vec: Point, to_vec: Point) -> Point:
+    if _batched(from_vec, to_vec):
+        from geometry import points
+        return points.vector_projection(from_vec, to_vec)
     if abs(from_vec) == 0:
         return Point(0, 0, 0)
     return to_vec.scale(scalar_projection(from_vec, to_vec))
 
 
 def is_parallel(p1: Point, p2: Point, tolerance=0.000001):
+    if _batched(p1, p2):
+        from geometry import points
+        return points.is_parallel(p1, p2, tolerance)
     raisezero([p1, p2])
     if p1 == p2:
         return True
@@ -220,6 +231,9 @@ def is_parallel(p1: Point, p2: Point, tolerance=0.000001):
 
 
 def is_anti_parallel(p1: Point, p2: Point, tolerance=0.000001):
+    if _batched(p1, p2):
+        from geometry import points
+        return points.is_anti_parallel(p1, p2, tolerance)
     raisezero([p1, p2])
     if p1 == - p2:
         return True
@@ -227,30 +241,42 @@ def is_anti_parallel(p1: Point, p2: Point, tolerance=0.000001):
 
 
 def is_perpendicular(p1: Point, p2: Point, tolerance=0.000001):
+    if _batched(p1, p2):
+        from geometry import points
+        return points.is_perpendicular(p1, p2, tolerance)
     raisezero([p1, p2])
     return abs(dot_product(p1, p2)) < tolerance
 
 
 def min_angle_between(p1: Point, p2: Point):
+    if _batched(p1, p2):
+        from geometry import points
+        return points.min_angle_between(p1, p2)
     raisezero([p1, p2])
     angle = angle_between(p1, p2) % pi
     return min(angle, pi - angle)
 
 
 def angle_between(p1: Point, p2: Point):
+    if _batched(p1, p2):
+        from geometry import points
+        return points.angle_between(p1, p2)
     raisezero([p1, p2])
     return acos(cos_angle_between(p1, p2))
 
 
 def arbitrary_perpendicular(v: Point) -> Point:
+    if _batched(v):
+        from geometry import points
+        return points.arbitrary_perpendicular(v)
     raisezero(v)
     if v.x == 0 and v.y == 0:
         return Point(0, 1, 0)
-    return Point(-v.y, v.x, 0).unit
+    return Point(-v.y, v.x, 0).unit()
 
 
 def raisezero(points: Union[Point, List[Point]]):
-    if isinstance(points, Point):
+    if not isinstance(points, (list, tuple)):
         _raisezero(points)
     else:
         for point in points:
@@ -258,7 +284,12 @@ def raisezero(points: Union[Point, List[Point]]):
 
 
 def _raisezero(point: Point, tolerance=0.000001):
-    if abs(point) < tolerance:
+    """raise if point, or any row of a Points, is shorter than tolerance"""
+    if isinstance(point, Point):
+        short = abs(point) < tolerance
+    else:
+        short = np.any(abs(point) < tolerance)
+    if short:
         raise ValueError('magnitude less than tolerance')
 
 def vector_norm(point: Point):
@@ -1,10 +1,29 @@
 from geometry.point import Point
+from geometry import pairwise
 import re
+import warnings
 import numpy as np
-import pandas as pd
 from numbers import Number
 
 
+def _as_float(data, dtype=None) -> np.ndarray:
+    """data as an array of dtype. With no dtype floating point data keep their own
+    precision and anything else becomes float64."""
+    data = np.asarray(data)
+    if dtype is None:
+        dtype = data.dtype if np.issubdtype(data.dtype, np.floating) else np.float64
+    return data.astype(dtype, copy=False)
+
+
+def _cast(other, like: np.ndarray) -> np.ndarray:
+    """an operand as an array of the dtype of floating point data like, so that float32
+    data are not promoted by float64 scalars, arrays or lists"""
+    other = np.asarray(other)
+    if np.issubdtype(like.dtype, np.floating) and np.issubdtype(other.dtype, np.number):
+        return other.astype(like.dtype, copy=False)
+    return other
+
+
 class Points(object):
     __array_priority__ = 15.0
     def __init__(self, data: np.array):
@@ -19,8 +38,17 @@ class Points(object):
         return Points(np.array(df))
 
     def to_pandas(self, prefix='', suffix='', columns=['x', 'y', 'z']):
+        import pandas as pd
         return pd.DataFrame(self.data, columns=[prefix + col + suffix for col in columns])
 
+    @staticmethod
+    def from_npy(path: str, mmap_mode: str = 'r'):
+        """load from a .npy file, by default as a read only memory map"""
+        return Points(np.load(path, mmap_mode=mmap_mode))
+
+    def to_npy(self, path: str):
+        np.save(path, self.data)
+
     @property
     def x(self):
         return self.data[:,0]
@@ -37,6 +65,13 @@ class Points(object):
     def count(self):
         return self.data.shape[0]  
 
+    @property
+    def dtype(self):
+        return self.data.dtype
+
+    def astype(self, dtype):
+        return Points(self.data.astype(dtype))
+
     def __abs__(self):
         return np.sqrt(self.x**2 + self.y**2 + self.z**2)
 
@@ -44,7 +79,7 @@ class Points(object):
         if isinstance(other, Points):
             return Points(self.data + other.data)
         elif isinstance(other, Point):
-            return Points(self.data + Points.from_point(other, self.count).data)
+            return Points(self.data + _cast(list(other), self.data))
         else:
             return NotImplemented
 
@@ -55,13 +90,13 @@ class Points(object):
         if isinstance(other, Points):
             return Points(self.data - other.data)
         elif isinstance(other, Point):
-            return Points(self.data - Points.from_point(other, self.count).data)
+            return Points(self.data - _cast(list(other), self.data))
         else:
             return NotImplemented
 
     def __rsub__(self, other):
         if isinstance(other, Point):
-            return Points(Points.from_point(other, self.count).data - self.data)
+            return Points(_cast(list(other), self.data) - self.data)
         else:
             return NotImplemented
 
@@ -70,8 +105,8 @@ class Points(object):
 
 
     @staticmethod
-    def from_point(point, count):
-        return Points(np.tile(list(point), (count, 1)))
+    def from_point(point, count, dtype=np.float64):
+        return Points(np.tile(np.array(list(point), dtype=dtype), (count, 1)))
 
     def __mul__(self, other):
         if isinstance(other, Points):
@@ -79,15 +114,15 @@ class Points(object):
         elif isinstance(other, np.ndarray):
             if other.ndim == 1:
                 if len(other) == self.count:
-                    return Points(self.data * other[:, np.newaxis])
+                    return Points(self.data * _cast(other, self.data)[:, np.newaxis])
                 else:
                     raise NotImplementedError("this will return an unexpected result")
             else:
                 return NotImplemented
         elif isinstance(other, Number):
-            return Points(self.data * other)
+            return Points(self.data * _cast(other, self.data))
         elif isinstance(other, Point):
-            return Points(self.data * list(other))
+            return Points(self.data * _cast(list(other), self.data))
         else:
             return NotImplemented
 
@@ -100,25 +135,74 @@ class Points(object):
         elif isinstance(other, np.ndarray):
             if other.ndim == 1:
                 if len(other) == self.count:
-                    return Points(self.data / other[:, np.newaxis])
+                    return Points(self.data / _cast(other, self.data)[:, np.newaxis])
                 else:
                     return NotImplemented
             else:
                 return NotImplemented
         elif isinstance(other, Number):
-            return Points(self.data / other)
+            return Points(self.data / _cast(other, self.data))
+        elif isinstance(other, Point):
+            return Points(self.data / _cast(list(other), self.data))
+
+    def _inplace_operand(self, other):
+        """other as an array that broadcasts against self.data, None if not supported"""
+        if isinstance(other, Points):
+            return other.data
+        elif isinstance(other, Point):
+            return _cast(list(other), self.data)
+        elif isinstance(other, Number):
+            return _cast(other, self.data)
+        elif isinstance(other, np.ndarray) and other.ndim == 1 and len(other) == self.count:
+            return _cast(other, self.data)[:, np.newaxis]
+
+    def __iadd__(self, other):
+        if isinstance(other, (Points, Point)):
+            self.data += self._inplace_operand(other)
+            return self
+        return NotImplemented
+
+    def __isub__(self, other):
+        if isinstance(other, (Points, Point)):
+            self.data -= self._inplace_operand(other)
+            return self
+        return NotImplemented
+
+    def __imul__(self, other):
+        other = self._inplace_operand(other)
+        if other is None:
+            return NotImplemented
+        self.data *= other
+        return self
+
+    def __itruediv__(self, other):
+        other = self._inplace_operand(other)
+        if other is None:
+            return NotImplemented
+        self.data /= other
+        return self
 
     def __neg__(self):
         return -1 * self
 
-    def scale(self, value):
+    def scale(self, value, out=None):
+        """points with the same directions and magnitude value. out (optional) is filled
+        with the result, it can be self."""
         if isinstance(value, Number):
-            return (value / abs(self)) * self
+            fac = _cast(value, self.data) / abs(self)
+            if out is None:
+                return fac * self
+            np.multiply(self.data, fac[:, np.newaxis], out=out.data)
+            return out
         else:
             return NotImplemented
 
-    def unit(self):
-        return self.scale(1)
+    def unit(self, out=None):
+        return self.scale(1, out)
+
+    def normalize_(self):
+        """scale self to unit length in place"""
+        return self.scale(1, self)
 
     def sines(self):
         return Points(np.sin(self.data))
@@ -132,22 +216,257 @@ class Points(object):
     def asines(self):
         return Points(np.asin(self.data))
 
-    def dot(self, other):
-        return np.einsum('ij,ij->i', self.data, other.data)
+    def to_rotation_matrix(self) -> np.ndarray:
+        '''n * 3 * 3 array of rotation matrices, as Point.to_rotation_matrix for each row'''
+        s = self.sines()
+        c = self.cosines()
+        mats = np.empty((self.count, 3, 3), dtype=s.dtype)
+        mats[:, 0, 0] = c.z * c.y
+        mats[:, 0, 1] = c.z * s.y * s.x - c.x * s.z
+        mats[:, 0, 2] = c.x * c.z * s.y + s.x * s.z
+        mats[:, 1, 0] = c.y * s.z
+        mats[:, 1, 1] = c.x * c.z + s.x * s.y * s.z
+        mats[:, 1, 2] = -1 * c.z * s.x + c.x * s.y * s.z
+        mats[:, 2, 0] = -1 * s.y
+        mats[:, 2, 1] = c.y * s.x
+        mats[:, 2, 2] = c.x * c.y
+        return mats
+
+    def dot(self, other, out: np.ndarray = None):
+        return np.einsum('ij,ij->i', self.data, other.data, out=out)
 
     def cross(self, other):
         return Points(np.cross(self.data, other.data))
 
-    def diff(self, dt:np.array):
-        return Points(np.gradient(self.data,axis=0) / np.tile(dt, (3,1)).T)
+    def _pair_data(self, other):
+        return _as_float(self.data), _as_float((self if other is None else other).data)
+
+    def distance_matrix(self, other=None, k: int = None, threshold: float = None, tile: int = None):
+        """distances between every row of self and every row of other, default self. k keeps the
+        k nearest per row as (values, indices), threshold the pairs closer than it as
+        (rows, cols, values). Computed in tiles of rows, see geometry.pairwise."""
+        return pairwise.distances(*self._pair_data(other), k, threshold, tile)
+
+    def cosine_matrix(self, other=None, k: int = None, threshold: float = None, tile: int = None):
+        """cosines of the angles between every row of self and every row of other, k keeps the
+        k largest, threshold the pairs above it, see distance_matrix"""
+        return pairwise.cosines(*self._pair_data(other), k, threshold, tile)
 
-    def remove_outliers(self, nstds = 2):
+    def angle_matrix(self, other=None, k: int = None, threshold: float = None, tile: int = None):
+        """angles between every row of self and every row of other, k keeps the k smallest,
+        threshold the pairs below it, see distance_matrix"""
+        return pairwise.angles(*self._pair_data(other), k, threshold, tile)
+
+    def parallel_mask(self, other=None, tolerance=0.000001, sparse: bool = False, tile: int = None):
+        """is_parallel for every row of self against every row of other, sparse gives (rows, cols)"""
+        return pairwise.parallel(*self._pair_data(other), tolerance, sparse, tile)
+
+    def perpendicular_mask(self, other=None, tolerance=0.000001, sparse: bool = False, tile: int = None):
+        """is_perpendicular for every row of self against every row of other, sparse gives (rows, cols)"""
+        return pairwise.perpendicular(*self._pair_data(other), tolerance, sparse, tile)
+
+    def diff(self, dt:np.array):
+        grad = np.gradient(self.data,axis=0)
+        return Points(grad / _cast(dt, grad)[:, np.newaxis])
+
+    def outlier_mask(self, nstds=2, strategy='sigma', window=11) -> np.ndarray:
+        """mask of the samples that remove_outliers would replace, non finite samples are
+        always included. strategy can be:
+            'sigma': magnitude more than nstds standard deviations from the mean magnitude
+            'mad': magnitude more than nstds scaled median absolute deviations from the
+                median magnitude of the surrounding window samples
+            'hold': only non finite samples, which are held at the last good value
+        """
         ab = abs(self)
-        std = np.nanstd(ab)
-        mean = np.nanmean(ab)
+        bad = ~np.isfinite(ab)
+        if strategy == 'sigma':
+            with np.errstate(invalid='ignore'):
+                bad |= abs(ab - np.nanmean(ab)) > nstds * np.nanstd(ab)
+        elif strategy == 'mad':
+            med = _rolling_nanmedian(ab, window)
+            mad = _rolling_nanmedian(abs(ab - med), window)
+            with np.errstate(invalid='ignore'):
+                bad |= abs(ab - med) > nstds * 1.4826 * mad
+        elif not strategy == 'hold':
+            raise ValueError("unknown outlier strategy {}".format(strategy))
+        return bad
+
+    def fill_outliers(self, nstds=2, strategy='sigma', window=11) -> np.ndarray:
+        """replace outliers in place with the last good sample, see outlier_mask for the
+        strategies. Outliers before the first good sample become nan.
+        Returns the mask of replaced samples."""
+        bad = self.outlier_mask(nstds, strategy, window)
+        _ffill(self.data, bad)
+        return bad
+
+    def remove_outliers(self, nstds=2, strategy='sigma', window=11):
+        pnts = Points(self.data.copy())
+        pnts.fill_outliers(nstds, strategy, window)
+        return pnts
+
+
+def _ffill(data: np.ndarray, bad: np.ndarray, first=np.nan) -> int:
+    """forward fill the bad rows of data in place, rows before the first good one are set to
+    first. Returns the index of the last good row, -1 if there isn't one."""
+    last = np.where(bad, -1, np.arange(len(bad)))
+    np.maximum.accumulate(last, out=last)
+    fill = bad & (last >= 0)
+    data[fill] = data[last[fill]]
+    data[last < 0] = first
+    return last[-1] if len(last) > 0 else -1
+
+
+def _rolling_nanmedian(x: np.ndarray, window: int, block: int = 65536) -> np.ndarray:
+    """centred rolling median, ignoring nans, computed in blocks to bound memory"""
+    half = window // 2
+    padded = np.pad(x.astype(float), (half, window - half - 1), constant_values=np.nan)
+    windows = np.lib.stride_tricks.sliding_window_view(padded, window)
+    out = np.empty(len(x))
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore', RuntimeWarning)
+        for i in range(0, len(x), block):
+            out[i:i + block] = np.nanmedian(windows[i:i + block], axis=1)
+    return out
+
+
+class RollingOutlierFilter(object):
+    def __init__(self, nstds: float = 2, window: int = 1000):
+        """Streaming version of Points.remove_outliers. Outliers are judged against the mean
+        and std of the magnitudes of the window samples before them rather than the whole
+        array, and replaced with the last good sample, which is carried from one chunk to the
+        next. The statistics use the replaced magnitudes, so one outlier does not hide the
+        next.
+
+        Args:
+            nstds (float): outlier threshold in standard deviations
+            window (int): number of samples in the rolling statistics
+        """
+        self.nstds = nstds
+        self.window = window
+        self.history = np.empty(0)
+        self.last_good = None
+
+    def __call__(self, pnts: Points) -> Points:
+        if pnts.count == 0:
+            return pnts
+        ab = abs(pnts)
+        nhist = len(self.history)
+        first = np.nan if self.last_good is None else np.sqrt(np.sum(self.last_good ** 2))
+
+        # each sample is judged on the filled magnitudes before it, which depend on the
+        # judgements before it. Iterate to the fixed point, the first k are settled after
+        # k passes but spikes are usually far enough apart to need only a few.
+        bad = np.isnan(ab)
+        while True:
+            filled = ab.copy()
+            _ffill(filled, bad, first)
+            ext = np.concatenate([self.history, filled])
+
+            valid = ~np.isnan(ext)
+            vals = np.where(valid, ext, 0)
+            s1 = np.concatenate([[0], np.cumsum(vals)])
+            s2 = np.concatenate([[0], np.cumsum(vals ** 2)])
+            n = np.concatenate([[0], np.cumsum(valid)])
+
+            stop = np.arange(nhist, len(ext))
+            start = np.maximum(stop - self.window, 0)
+            count = n[stop] - n[start]
+            mean = (s1[stop] - s1[start]) / np.maximum(count, 1)
+            std = np.sqrt(np.maximum((s2[stop] - s2[start]) / np.maximum(count, 1) - mean ** 2, 0))
+
+            judge = np.isnan(ab) | ((count > 1) & (abs(ab - mean) > self.nstds * std))
+            if np.array_equal(judge, bad):
+                break
+            bad = judge
+
+        data = pnts.data.copy()
+        last = _ffill(data, bad, np.nan if self.last_good is None else self.last_good)
+        if last >= 0:
+            self.last_good = data[last].copy()
+        self.history = ext[-self.window:]
+
+        return Points(data)
+
+
+# Batched versions of the point.py helpers. The functions in point.py hand over to these when
+# given Points, a Point paired with Points is compared with every row. Zero vectors give nan,
+# False or 0 rather than raising, is_zero gives the mask of them.
+
+def _rows(p1, p2):
+    """the data of a Point / Points pair as float arrays that broadcast row wise"""
+    dtype = _as_float((p1 if isinstance(p1, Points) else p2).data).dtype
+    return tuple(
+        _as_float(p.data) if isinstance(p, Points) else np.array(list(p), dtype=dtype)
+        for p in (p1, p2)
+    )
+
+
+def _norms(data: np.ndarray) -> np.ndarray:
+    return np.sqrt(np.sum(data * data, axis=-1))
+
+
+def is_zero(points: Points, tolerance=0.000001) -> np.ndarray:
+    """mask of the rows with a magnitude below tolerance, which point.raisezero rejects"""
+    return abs(points) < tolerance
+
+
+def cos_angle_between(p1, p2) -> np.ndarray:
+    a, b = _rows(p1, p2)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        cos = np.sum(a * b, axis=-1) / (_norms(a) * _norms(b))
+    zero = (_norms(a) < 0.000001) | (_norms(b) < 0.000001)
+    return np.where(zero, np.nan, cos)
+
+
+def scalar_projection(from_vec, to_vec) -> np.ndarray:
+    cos = cos_angle_between(from_vec, to_vec)
+    return np.where(np.isnan(cos), 0, cos * _norms(_rows(from_vec, to_vec)[0]))
+
+
+def vector_projection(from_vec, to_vec) -> Points:
+    a, b = _rows(from_vec, to_vec)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        fac = scalar_projection(from_vec, to_vec) / _norms(b)
+    out = b * np.where(np.isfinite(fac), fac, 0)[..., np.newaxis]
+    return Points(np.broadcast_to(out, np.broadcast(a, b).shape).copy())
+
+
+def is_parallel(p1, p2, tolerance=0.000001) -> np.ndarray:
+    a, b = _rows(p1, p2)
+    cos = cos_angle_between(p1, p2)
+    with np.errstate(invalid='ignore'):
+        close = np.abs(np.abs(cos) - 1) < tolerance
+    return (close | np.all(a == b, axis=-1)) & ~np.isnan(cos)
+
+
+def is_anti_parallel(p1, p2, tolerance=0.000001) -> np.ndarray:
+    a, b = _rows(p1, p2)
+    cos = cos_angle_between(p1, p2)
+    with np.errstate(invalid='ignore'):
+        close = np.abs(cos + 1) < tolerance
+    return (close | np.all(a == -b, axis=-1)) & ~np.isnan(cos)
+
+
+def is_perpendicular(p1, p2, tolerance=0.000001) -> np.ndarray:
+    a, b = _rows(p1, p2)
+    nonzero = (_norms(a) >= 0.000001) & (_norms(b) >= 0.000001)
+    return (np.abs(np.sum(a * b, axis=-1)) < tolerance) & nonzero
+
+
+def angle_between(p1, p2) -> np.ndarray:
+    return np.arccos(np.clip(cos_angle_between(p1, p2), -1, 1))
+
 
-        data = self.data.copy()
+def min_angle_between(p1, p2) -> np.ndarray:
+    angle = angle_between(p1, p2) % np.pi
+    return np.minimum(angle, np.pi - angle)
 
-        data[abs(ab - mean) > nstds * std, :] = [np.nan, np.nan, np.nan]
 
-        return Points(pd.DataFrame(data).fillna(method="ffill").to_numpy())
\ No newline at end of file
+def arbitrary_perpendicular(v: Points) -> Points:
+    """unit vectors perpendicular to each row, (0, 1, 0) for rows along z and zero rows"""
+    data = _as_float(v.data)
+    out = np.zeros_like(data)
+    out[:, 0], out[:, 1] = -data[:, 1], data[:, 0]
+    on_z = (data[:, 0] == 0) & (data[:, 1] == 0)
+    out[on_z] = [0, 1, 0]
+    return Points(out).unit()
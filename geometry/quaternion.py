@@ -1,11 +1,13 @@
 
-from . import Point, dot_product, cross_product, Points
+from . import Point, Points
 from math import atan2, asin, copysign, pi, sqrt
 from typing import List, Dict, Union
 import numpy as np
 
 
 class Quaternion():
+    __slots__ = ['w', 'x', 'y', 'z']
+
     def __init__(self, w: float, x: float, y: float, z: float):
         self.w = w
         self.x = x
@@ -50,13 +52,11 @@ class Quaternion():
     def __mul__(self, other):
         if isinstance(other, Quaternion):
             return Quaternion(
-                *tuple(
-                    [self.w * other.w - dot_product(self.axis, other.axis)] +
-                    list(
-                        self.w * other.axis +
-                        other.w * self.axis +
-                        cross_product(self.axis, other.axis)
-                    )))
+                self.w * other.w - (self.x * other.x + self.y * other.y + self.z * other.z),
+                self.w * other.x + other.w * self.x + (self.y * other.z - self.z * other.y),
+                self.w * other.y + other.w * self.y + (self.z * other.x - self.x * other.z),
+                self.w * other.z + other.w * self.z + (self.x * other.y - self.y * other.x)
+            )
         elif isinstance(other, float):
             return Quaternion(
                 other * self.w,
@@ -72,7 +72,7 @@ class Quaternion():
         if isinstance(point, Points):
             return NotImplemented
         elif isinstance(point, Point):
-            return (self * Quaternion(*[0] + list(point)) * self.inverse()).axis
+            return (self * Quaternion(0, point.x, point.y, point.z) * self.inverse()).axis
         else:
             return NotImplemented
 
@@ -89,36 +89,40 @@ class Quaternion():
         )
 
     @staticmethod
-    def from_axis_angle(axangle: Point):
+    def from_axis_angle(axangle: Point, factor: float = 0.5):
+        """rotation of abs(axangle) about the direction of axangle. factor scales the angle
+        to the half angle of the quaternion, 0.5 is the usual axis angle."""
         angle = abs(axangle)
-        if (angle < .001):
-            return Quaternion(1.0, 0.0, 0.0, 0.0)
-        axis = axangle / angle
-        s = np.sin(angle/2)
-        c = np.cos(angle/2)
-        return Quaternion(c, axis.x * s, axis.y * s, axis.z * s)
-
-    # from https://www.euclideanspace.com/maths/geometry/rotations/conversions/quaternionToAngle/index.htm
+        half = angle * factor
+        if angle < 1e-4:
+            # series of sin(half) / angle for small angles
+            fac = factor * (1 - half * half / 6)
+        else:
+            fac = np.sin(half) / angle
+        return Quaternion(np.cos(half), axangle.x * fac, axangle.y * fac, axangle.z * fac)
+
     def to_axis_angle(self):
-        """to a point of axis angles. must be normalized first."""
-        if (self.w > 1):
-            self.norm()
-        angle = 2 * np.arccos(self.w)
-        s = np.sqrt(1 - self.w**2)
-        if (s < .001):
-            return self.axis * angle
+        """to a point of axis angles, the rotation angle in [0, pi] times the unit axis.
+        must be normalized first. Same as Quaternions.to_axis_angle."""
+        sign = -1.0 if self.w < 0 else 1.0
+        w = abs(self.w)
+        s = np.sqrt(self.x * self.x + self.y * self.y + self.z * self.z)
+        if s < 1e-4:
+            # series of atan2(s, w) / s for small angles
+            fac = (1 - s * s / (3 * w * w)) / w
         else:
-            return self.axis * angle / s
+            fac = np.arctan2(s, w) / s
+        return self.axis * (fac * sign) * 2
 
     @staticmethod
     def axis_rates(q, qdot):
         wdash = qdot * q.conjugate()
-        return wdash.norm().to_axis_angle() * 2
+        return wdash.norm().to_axis_angle()
 
     @staticmethod
     def body_axis_rates(q, qdot):
         wdash = q.conjugate() * qdot
-        return wdash.norm().to_axis_angle() * 2
+        return wdash.norm().to_axis_angle()
 
     def rotate(self, rate: Point):
         return (Quaternion.from_axis_angle(rate, 0.5) * self).norm()
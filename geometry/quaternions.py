@@ -1,10 +1,154 @@
-from typing import Union
+from typing import Union, Iterable, Tuple
 from geometry.quaternion import Quaternion
 from numbers import Number
 from geometry import Point, Points
+from geometry.points import RollingOutlierFilter, _as_float, _cast
 
 import numpy as np
-import pandas as pd
+
+
+def _rotate(q: np.ndarray, v: np.ndarray, out: np.ndarray = None) -> np.ndarray:
+    """rotate vectors v (n*3 or 3) by unit quaternions q (n*4 or 4) in a single pass,
+    using v + 2w(q x v) + 2q x (q x v). out can be v to rotate in place."""
+    w, x, y, z = q[..., 0], q[..., 1], q[..., 2], q[..., 3]
+    vx, vy, vz = v[..., 0], v[..., 1], v[..., 2]
+
+    tx = 2 * (y * vz - z * vy)
+    ty = 2 * (z * vx - x * vz)
+    tz = 2 * (x * vy - y * vx)
+
+    if out is None:
+        out = np.empty(np.broadcast(tx, v[..., 0]).shape + (3,), dtype=np.result_type(q, v))
+    out[..., 0] = vx + w * tx + (y * tz - z * ty)
+    out[..., 1] = vy + w * ty + (z * tx - x * tz)
+    out[..., 2] = vz + w * tz + (x * ty - y * tx)
+    return out
+
+
+def _mul(a: np.ndarray, b: np.ndarray, out: np.ndarray = None) -> np.ndarray:
+    """Hamilton product of the quaternion arrays a and b (n*4 or 4), broadcasting.
+    out (optional) is filled with the result, it can be a or b."""
+    aw, ax, ay, az = a[..., 0], a[..., 1], a[..., 2], a[..., 3]
+    bw, bx, by, bz = b[..., 0], b[..., 1], b[..., 2], b[..., 3]
+
+    w = aw * bw - (ax * bx + ay * by + az * bz)
+    x = aw * bx + bw * ax + (ay * bz - az * by)
+    y = aw * by + bw * ay + (az * bx - ax * bz)
+    z = aw * bz + bw * az + (ax * by - ay * bx)
+
+    if out is None:
+        out = np.empty(w.shape + (4,), dtype=np.result_type(a, b))
+    out[..., 0] = w
+    out[..., 1] = x
+    out[..., 2] = y
+    out[..., 3] = z
+    return out
+
+
+def _normalize(q: np.ndarray) -> np.ndarray:
+    """normalise the quaternion array q in place"""
+    q /= np.sqrt(np.sum(q * q, axis=-1))[..., np.newaxis]
+    return q
+
+
+def _scan(q: np.ndarray, right: bool = True, normalize: bool = False, resets: np.ndarray = None) -> np.ndarray:
+    """inclusive prefix products of the quaternion array q (n*4) in place, q0 q1 .. qi if right
+    else qi .. q1 q0. resets (optional) is a boolean mask of the rows that start a new product,
+    it is modified. A work efficient up and down sweep scan on strided views, about 2n products
+    in 2log2(n) vectorised passes. It is fastest when q is component major, ie an F ordered view."""
+    n = len(q)
+
+    def combine(earlier, later, earlier_reset, later_reset):
+        if later_reset is None:
+            _mul(earlier, later, later) if right else _mul(later, earlier, later)
+            if normalize:
+                _normalize(later)
+        else:
+            keep = ~later_reset
+            prod = _mul(earlier[keep], later[keep]) if right else _mul(later[keep], earlier[keep])
+            later[keep] = _normalize(prod) if normalize else prod
+            later_reset |= earlier_reset
+
+    def sweep(first, second, step):
+        later = q[second::2 * step]
+        earlier = q[first::2 * step][:len(later)]
+        if resets is None:
+            combine(earlier, later, None, None)
+        else:
+            later_reset = resets[second::2 * step]
+            combine(earlier, later, resets[first::2 * step][:len(later)], later_reset)
+
+    step = 1
+    while step < n:
+        sweep(step - 1, 2 * step - 1, step)
+        step *= 2
+    while step > 1:
+        step //= 2
+        sweep(2 * step - 1, 3 * step - 1, step)
+    return q
+
+
+def _conjugate(q: np.ndarray, out: np.ndarray = None) -> np.ndarray:
+    if out is None:
+        out = q.copy()
+    elif out is not q:
+        out[...] = q
+    out[..., 1:] *= -1
+    return out
+
+
+# below this the sin and atan ratios in _log and _exp come from their series
+_SMALL_ANGLE = 1e-4
+
+
+def _log(q: np.ndarray) -> np.ndarray:
+    """vector part of the log of the unit quaternions q, n*3. q and -q are the same
+    rotation, the log is taken for the one with w >= 0 so its norm is at most pi / 2."""
+    w, x, y, z = q[..., 0], q[..., 1], q[..., 2], q[..., 3]
+    sign = np.where(w < 0, -1, 1).astype(q.dtype)
+    w = np.abs(w)
+    s = np.sqrt(x * x + y * y + z * z)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        # atan2(s, w) / s, which is 1 / w - s**2 / 3w**3 ... as s -> 0
+        fac = np.where(
+            s < _SMALL_ANGLE,
+            (1 - s * s / (3 * w * w)) / w,
+            np.arctan2(s, w) / s
+        )
+    return q[..., 1:] * (fac * sign)[..., np.newaxis]
+
+
+def _exp(v: np.ndarray) -> np.ndarray:
+    """unit quaternions that are the exp of the pure quaternions with vector parts v, n*4"""
+    angle = np.sqrt(np.sum(v * v, axis=-1))
+    with np.errstate(invalid='ignore', divide='ignore'):
+        fac = np.where(
+            angle < _SMALL_ANGLE,
+            1 - angle * angle / 6,
+            np.sin(angle) / angle
+        )
+    out = np.empty(v.shape[:-1] + (4,), dtype=v.dtype)
+    out[..., 0] = np.cos(angle)
+    out[..., 1:] = v * fac[..., np.newaxis]
+    return out
+
+
+def _slerp(q0: np.ndarray, q1: np.ndarray, u: np.ndarray) -> np.ndarray:
+    """spherical linear interpolation between unit quaternions q0 and q1, taking the short path"""
+    dot = np.sum(q0 * q1, axis=-1)
+    sign = np.where(dot < 0, -1, 1).astype(dot.dtype)
+    dot = np.clip(dot * sign, -1.0, 1.0)
+
+    angle = np.arccos(dot)
+    sin_angle = np.sin(angle)
+    small = sin_angle < 1e-9
+    with np.errstate(invalid='ignore', divide='ignore'):
+        a = np.where(small, 1 - u, np.sin((1 - u) * angle) / sin_angle)
+        b = np.where(small, u, np.sin(u * angle) / sin_angle) * sign
+
+    out = q0 * a[..., np.newaxis] + q1 * b[..., np.newaxis]
+    out /= np.linalg.norm(out, axis=-1)[..., np.newaxis]
+    return out
 
 
 class Quaternions():
@@ -33,8 +177,17 @@ class Quaternions():
         return Quaternions(np.array(df))
 
     def to_pandas(self, prefix='', suffix='', columns=['w', 'x', 'y', 'z']):
+        import pandas as pd
         return pd.DataFrame(self.data, columns=[prefix + col + suffix for col in columns])
 
+    @staticmethod
+    def from_npy(path: str, mmap_mode: str = 'r'):
+        """load from a .npy file, by default as a read only memory map"""
+        return Quaternions(np.load(path, mmap_mode=mmap_mode))
+
+    def to_npy(self, path: str):
+        np.save(path, self.data)
+
     def __abs__(self):
         return np.sqrt(self.w**2 + self.x**2 + self.y**2 + self.z**2)
 
@@ -42,46 +195,91 @@ class Quaternions():
     def axis(self):
         return Points(self.data[:, 1:])
 
-    def norm(self):
+    def norm(self, out=None):
+        """unit quaternions. out (optional) is filled with the result, it can be self."""
         dab = 1 / abs(self)
-        return self * dab
-
-    def conjugate(self):
-
-        return Quaternions(self.data * np.array([1, -1, -1, -1]))
-
-    def inverse(self):
-        return self.conjugate().norm()
+        if out is None:
+            return self * dab
+        np.multiply(self.data, dab[:, np.newaxis], out=out.data)
+        return out
+
+    def normalize_(self):
+        """normalise self in place"""
+        return self.norm(self)
+
+    def conjugate(self, out=None):
+        """out (optional) is filled with the result, it can be self"""
+        if out is None:
+            return Quaternions(_conjugate(self.data))
+        _conjugate(self.data, out.data)
+        return out
+
+    def conjugate_(self):
+        """conjugate self in place"""
+        _conjugate(self.data, self.data)
+        return self
+
+    def inverse(self, out=None):
+        return self.conjugate(out).normalize_()
 
     @property
     def count(self):
         return self.data.shape[0]
 
+    @property
+    def dtype(self):
+        return self.data.dtype
+
+    def astype(self, dtype):
+        return Quaternions(self.data.astype(dtype))
+
     def __mul__(self, other):
         if isinstance(other, Quaternions):
-            pass
-            if not self.count == other.count:
-                return NotImplemented
+            if self.count == other.count or 1 in (self.count, other.count):
+                return Quaternions(_mul(self.data, other.data))
             else:
-                w = self.w * other.w - self.axis.dot(other.axis)
-#
-                xyz = self.w * other.axis + other.w * self.axis + \
-                    self.axis.cross(other.axis)
-
-                return Quaternions(np.column_stack([w, xyz.data]))
+                return NotImplemented
 
         elif isinstance(other, Number):
-            return Quaternions(self.data * other)
+            return Quaternions(self.data * _cast(other, self.data))
         elif isinstance(other, np.ndarray):
             if other.ndim == 1:
                 if len(other) == self.count:
-                    return Quaternions(self.data * other[:, np.newaxis])
+                    return Quaternions(self.data * _cast(other, self.data)[:, np.newaxis])
                 else:
                     return NotImplemented
             else:
                 return NotImplemented
         elif isinstance(other, Quaternion):
-            return self * Quaternions.from_quaternion(other, self.count)
+            return Quaternions(_mul(self.data, _cast(list(other), self.data)))
+        else:
+            return NotImplemented
+
+    def __imul__(self, other):
+        if isinstance(other, Quaternions):
+            if other.count == self.count or other.count == 1:
+                _mul(self.data, other.data, self.data)
+                return self
+            return NotImplemented
+        elif isinstance(other, Quaternion):
+            _mul(self.data, _cast(list(other), self.data), self.data)
+            return self
+        elif isinstance(other, Number):
+            self.data *= _cast(other, self.data)
+            return self
+        elif isinstance(other, np.ndarray) and other.ndim == 1 and len(other) == self.count:
+            self.data *= _cast(other, self.data)[:, np.newaxis]
+            return self
+        else:
+            return NotImplemented
+
+    def __itruediv__(self, other):
+        if isinstance(other, Number):
+            self.data /= _cast(other, self.data)
+            return self
+        elif isinstance(other, np.ndarray) and other.ndim == 1 and len(other) == self.count:
+            self.data /= _cast(other, self.data)[:, np.newaxis]
+            return self
         else:
             return NotImplemented
 
@@ -89,19 +287,20 @@ class Quaternions():
         if isinstance(other, Quaternions):
             return NotImplemented('this should have gone to __mul__')
         elif isinstance(other, float):
-            return Quaternions(self.data * other)
+            return Quaternions(self.data * _cast(other, self.data))
         elif isinstance(other, Quaternion):
-            return Quaternions.from_quaternion(other, self.count) * self
+            return Quaternions(_mul(_cast(list(other), self.data), self.data))
         else:
             return NotImplemented
 
     @staticmethod
-    def from_quaternion(quat: Quaternion, count: int):
-        return Quaternions(np.tile(list(quat), (count, 1)))
+    def from_quaternion(quat: Quaternion, count: int, dtype=np.float64):
+        return Quaternions(np.tile(np.array(list(quat), dtype=dtype), (count, 1)))
 
     @staticmethod
-    def from_euler(eul: Points):
-        half = eul * 0.5
+    def from_euler(eul: Points, dtype=None):
+        """dtype defaults to that of eul, or float64 if eul is not floating point"""
+        half = Points(_as_float(eul.data, dtype)) * 0.5
 
         c = half.cosines()
         s = half.sines()
@@ -115,71 +314,318 @@ class Quaternions():
             ]).T
         )
 
-    def transform_point(self, point: Union[Point, Points]):
-        '''Transform a point by the rotation described by self'''
-        if isinstance(point, Point):
-            qdata = np.tile([0] + list(point), (self.count, 1))
+    def to_euler(self, seq: str = 'xyz', unwrap: bool = False) -> Points:
+        """euler angles in the order of seq, three axes in lower case for extrinsic rotations
+        (about the fixed axes) or upper case for intrinsic (about the rotated axes). The default
+        'xyz' gives roll, pitch, yaw as Quaternion.to_euler and is the inverse of from_euler,
+        'ZYX' gives the same rotations as yaw, pitch, roll.
+
+        Uses the direct method of Bernardes and Viollet, https://doi.org/10.1371/journal.pone.0276302
+        At gimbal lock the third rotation is set to zero and the first takes all of it.
+
+        Args:
+            seq (str): the rotation sequence, any of the 12 Tait Bryan or proper Euler sequences
+            unwrap (bool): remove the 2 pi jumps between consecutive samples, for
+                continuous angles to differentiate
+        """
+        if len(seq) != 3 or not (seq.islower() or seq.isupper()) or \
+                not set(seq.lower()) <= set('xyz') or seq[0] == seq[1] or seq[1] == seq[2]:
+            raise ValueError("unknown euler sequence {}".format(seq))
+        extrinsic = seq.islower()
+        # the method is for extrinsic sequences, intrinsic ones are the reverse of them
+        i, j, k = ['xyz'.index(axis) for axis in (seq.lower() if extrinsic else seq.lower()[::-1])]
+        symmetric = i == k
+        if symmetric:
+            k = 3 - i - j
+        sign = (i - j) * (j - k) * (k - i) // 2
+
+        w, v = self.data[:, 0], self.data[:, 1:]
+        if symmetric:
+            a, b, c, d = w, v[:, i], v[:, j], v[:, k] * sign
+        else:
+            a, b = w - v[:, j], v[:, i] + v[:, k] * sign
+            c, d = v[:, j] + w, v[:, k] * sign - v[:, i]
+
+        second = 2 * np.arctan2(np.hypot(c, d), np.hypot(a, b))
+        half_sum = np.arctan2(b, a)
+        half_diff = np.arctan2(d, c)
+
+        lock_zero = np.abs(second) <= 1e-7
+        lock = lock_zero | (np.abs(second - np.pi) <= 1e-7)
+        locked = np.where(lock_zero, 2 * half_sum, 2 * half_diff * (-1 if extrinsic else 1))
+        first = np.where(lock, locked if extrinsic else 0, half_sum - half_diff)
+        third = np.where(lock, 0 if extrinsic else locked, half_sum + half_diff)
+
+        if not symmetric:
+            third *= sign
+            second -= np.pi / 2
+        if extrinsic:
+            angles = np.column_stack([first, second, third])
+        else:
+            angles = np.column_stack([third, second, first])
+        angles[angles < -np.pi] += 2 * np.pi
+        angles[angles > np.pi] -= 2 * np.pi
+        if unwrap:
+            angles = np.unwrap(angles, axis=0)
+        return Points(angles)
+
+    def to_rotation_matrix(self) -> np.ndarray:
+        """n * 3 * 3 array of rotation matrices, as Quaternion.to_rotation_matrix for each row"""
+        n = self.norm()
+        s, x, y, z = n.w, n.x, n.y, n.z
+        x2, y2, z2 = x**2, y**2, z**2
+
+        mats = np.empty((self.count, 3, 3), dtype=n.dtype)
+        mats[:, 0, 0] = 1 - 2 * (y2 + z2)
+        mats[:, 0, 1] = 2 * x * y - 2 * s * z
+        mats[:, 0, 2] = 2 * s * y + 2 * x * z
+        mats[:, 1, 0] = 2 * x * y + 2 * s * z
+        mats[:, 1, 1] = 1 - 2 * (x2 + z2)
+        mats[:, 1, 2] = -2 * s * x + 2 * y * z
+        mats[:, 2, 0] = -2 * s * y + 2 * x * z
+        mats[:, 2, 1] = 2 * s * x + 2 * y * z
+        mats[:, 2, 2] = 1 - 2 * (x2 + y2)
+        return mats
 
-            return (self * Quaternions(qdata) * self.inverse()).axis
+    @staticmethod
+    def from_rotation_matrix(matrices: np.ndarray, dtype=None):
+        """from an n * 3 * 3 array of rotation matrices, as Quaternion.from_rotation_matrix
+        for each one. The four Shepperd cases are selected with masks rather than branches."""
+        m = np.swapaxes(_as_float(matrices, dtype), 1, 2)
+        m00, m01, m02 = m[:, 0, 0], m[:, 0, 1], m[:, 0, 2]
+        m10, m11, m12 = m[:, 1, 0], m[:, 1, 1], m[:, 1, 2]
+        m20, m21, m22 = m[:, 2, 0], m[:, 2, 1], m[:, 2, 2]
+
+        neg_z = m22 < 0
+        cases = [
+            neg_z & (m00 > m11),
+            neg_z & ~(m00 > m11),
+            ~neg_z & (m00 < -m11),
+        ]
+
+        t = np.select(cases, [
+            1 + m00 - m11 - m22,
+            1 - m00 + m11 - m22,
+            1 - m00 - m11 + m22,
+        ], 1 + m00 + m11 + m22)
+
+        q = np.select([c[:, np.newaxis] for c in cases], [
+            np.column_stack([m12 - m21, t, m01 + m10, m20 + m02]),
+            np.column_stack([m20 - m02, m01 + m10, t, m12 + m21]),
+            np.column_stack([m01 - m10, m20 + m02, m12 + m21, t]),
+        ], np.column_stack([t, m12 - m21, m20 - m02, m01 - m10]))
+
+        q *= (0.5 / np.sqrt(t))[:, np.newaxis]
+        return Quaternions(q)
+
+    def transform_point(self, point: Union[Point, Points], out: Points = None):
+        '''Transform a point by the rotation described by self, self must be normalised.
+        A single quaternion is applied to all the points. out (optional) is filled with
+        the result, it can be point to rotate in place.'''
+        if isinstance(point, Point):
+            data = _cast(list(point), self.data)
         elif isinstance(point, Points):
-            if point.count == self.count:
-
-                qdata = np.column_stack((np.zeros(self.count), point.data))
-
-                return (self * Quaternions(qdata) * self.inverse()).axis
-            return NotImplemented
+            if not (point.count == self.count or 1 in (point.count, self.count)):
+                return NotImplemented
+            data = point.data
         else:
             return NotImplemented
+        if out is None:
+            return Points(_rotate(self.data, data))
+        _rotate(self.data, data, out.data)
+        return out
 
     @staticmethod
-    def from_axis_angle(angles: Points, factor: float = 1):
+    def from_axis_angle(angles: Points, factor: float = 0.5, dtype=None):
+        """rotations of abs(angles) about the directions of angles. factor scales the angle
+        to the half angle of the quaternion, 0.5 is the usual axis angle."""
+        angles = Points(_as_float(angles.data, dtype))
         ab = abs(angles)
-        fact = ab * factor
-        s = np.sin(fact)
-        c = np.cos(fact)
-
-        qdat = np.array([
-            ab * c, angles.x * s, angles.y * s, angles.z * s
-        ]).T
-
-        qdat[abs(Quaternions(qdat)) == 0] = np.array([[1, 0, 0, 0]])
+        half = ab * factor
+        with np.errstate(invalid='ignore', divide='ignore'):
+            # sin(half) / ab, which is factor - factor * half**2 / 6 ... as ab -> 0
+            fac = np.where(ab < _SMALL_ANGLE, factor * (1 - half * half / 6), np.sin(half) / ab)
+
+        qdat = np.empty((angles.count, 4), dtype=angles.dtype)
+        qdat[:, 0] = np.cos(half)
+        qdat[:, 1:] = angles.data * fac[:, np.newaxis]
         return Quaternions(qdat)
 
+    def cumprod(self, right: bool = True, resets: np.ndarray = None, normalize: bool = False,
+                executor=None):
+        """all the prefix products, q0 q1 .. qi for right (composing body frame increments)
+        or qi .. q1 q0 for left (world frame increments).
+
+        Args:
+            right (bool): the order to multiply in
+            resets (np.ndarray, optional): indices of the rows that start a new product
+            normalize (bool): normalise the partial products as they are formed
+            executor (ChunkExecutor, optional): scan chunks of rows on its workers, then
+                apply the product of the preceding chunks to each one
+        """
+        out = np.ascontiguousarray(self.data.T).T
+        flags = None
+        if resets is not None:
+            flags = np.zeros(self.count, dtype=bool)
+            flags[resets] = True
+        if executor is None:
+            _scan(out, right, normalize, flags)
+            return Quaternions(out)
+
+        ranges = executor.ranges(self.count)
+        executor.map(lambda start, stop: _scan(
+            out[start:stop], right, normalize, None if flags is None else flags[start:stop].copy()
+        ), self.count)
+
+        # the product of everything before each chunk, up to the last reset
+        carries, carry = {}, None
+        for start, stop in ranges:
+            first = stop if flags is None else start + int(np.argmax(np.append(flags[start:stop], True)))
+            carries[start] = (carry, first)
+            if carry is None or first < stop:
+                carry = out[stop - 1].copy()
+            else:
+                carry = _mul(carry, out[stop - 1]) if right else _mul(out[stop - 1], carry)
+
+        def apply(start, stop):
+            carry, first = carries[start]
+            if carry is not None and first > start:
+                chunk = out[start:first]
+                _mul(carry, chunk, chunk) if right else _mul(chunk, carry, chunk)
+                if normalize:
+                    _normalize(chunk)
+        executor.map(apply, self.count)
+        return Quaternions(out)
+
     def to_axis_angle(self):
-        """to a point of axis angles. must be normalized first."""
-        angle = np.arccos(self.w)
-        s = np.sqrt(1 - self.w**2)
-        return self.axis * angle / s
+        """to a point of axis angles, the rotation angle in [0, pi] times the unit axis.
+        must be normalized first."""
+        return Points(_log(self.data) * 2)
+
+    def log(self) -> Points:
+        """vector parts of the logs, half the axis angles. must be normalized first."""
+        return Points(_log(self.data))
+
+    @staticmethod
+    def exp(v: Points):
+        """the unit quaternions that are the exp of the pure quaternions with vector parts v"""
+        return Quaternions(_exp(v.data))
+
+    def continuous(self):
+        """flip the signs of samples so that consecutive quaternions are in the same hemisphere,
+        which leaves the rotations unchanged"""
+        dots = np.einsum('ij,ij->i', self.data[:-1], self.data[1:])
+        signs = np.concatenate([[1.0], np.cumprod(np.where(dots < 0, -1.0, 1.0))])
+        return self * signs
+
+    def resample(self, t_src: np.ndarray, t_dst: np.ndarray, mode: str = 'slerp'):
+        """interpolate normalised quaternions sampled at the monotonic times t_src to the times
+        t_dst. Times outside t_src are clamped to the end samples.
+
+        Args:
+            t_src (np.ndarray): the sample times of self
+            t_dst (np.ndarray): the times to interpolate to
+            mode (str): 'slerp' for piecewise spherical linear interpolation or 'squad' for
+                spherical cubic interpolation, which is smooth through the samples.
+        """
+        if self.count < 2:
+            raise ValueError("need at least two samples to interpolate")
+        q = self.continuous().data
+
+        idx = np.clip(np.searchsorted(t_src, t_dst, side='right') - 1, 0, self.count - 2)
+        u = np.clip((t_dst - t_src[idx]) / (t_src[idx + 1] - t_src[idx]), 0, 1).astype(q.dtype)
+
+        if mode == 'slerp':
+            return Quaternions(_slerp(q[idx], q[idx + 1], u))
+        elif mode == 'squad':
+            # inner control points, s_i = q_i exp(-(log(q_i* q_i+1) + log(q_i* q_i-1)) / 4)
+            qinv = _conjugate(q[1:-1])
+            s = q.copy()
+            s[1:-1] = _mul(q[1:-1], _exp(
+                -(_log(_mul(qinv, q[2:])) + _log(_mul(qinv, q[:-2]))) / 4
+            ))
+            return Quaternions(_slerp(
+                _slerp(q[idx], q[idx + 1], u),
+                _slerp(s[idx], s[idx + 1], u),
+                2 * u * (1 - u)
+            ))
+        else:
+            raise ValueError("unknown interpolation mode {}".format(mode))
 
     @staticmethod
     def axis_rates(q, qdot):
         wdash = qdot * q.conjugate()
-        return wdash.norm().to_axis_angle() * 2
+        return wdash.normalize_().to_axis_angle()
 
     @staticmethod
     def body_axis_rates(q, qdot):
         wdash = q.conjugate() * qdot
-        return wdash.norm().to_axis_angle() * 2
+        return wdash.normalize_().to_axis_angle()
 
     def rotate(self, rate: Points):
-        return (Quaternions.from_axis_angle(rate, 0.5) * self).norm()
+        return (Quaternions.from_axis_angle(rate, 0.5) * self).normalize_()
 
     def body_rotate(self, rate: Points):
-        return (self * Quaternions.from_axis_angle(rate, 0.5)).norm()
+        return (self * Quaternions.from_axis_angle(rate, 0.5)).normalize_()
+
+    def _diff_rates(self, dt: np.array, body: bool, start: int = 0, stop: int = None) -> Points:
+        """forward difference rates for rows start to stop, the last row repeats the rate
+        of the one before it"""
+        stop = self.count if stop is None else stop
+        q, qdot = self.data[start:stop], self.data[start + 1:stop + 1]
+        dts = dt[start:stop] if np.ndim(dt) > 0 else dt
+        if stop == self.count and stop > start:
+            last = max(self.count - 2, 0)
+            q = np.vstack([q[:-1], self.data[last:last + 1]])
+            qdot = np.vstack([qdot, self.data[-1:]])
+            if np.ndim(dt) > 0:
+                dts = np.concatenate([dts[:-1], dt[last:last + 1]])
+        rates = Quaternions.body_axis_rates if body else Quaternions.axis_rates
+        return rates(Quaternions(q), Quaternions(qdot)) / dts
 
     def diff(self, dt: np.array) -> Points:
-        newqs = Quaternions.axis_rates(
-            self,
-            Quaternions(np.vstack([self.data[1:, :], self.data[-1, :]]))
-        ) / dt
-        return newqs.remove_outliers(2) # Bodge to get rid of phase jump
-        
-
+        """world frame rates, the difference to the next sample over dt"""
+        return self._diff_rates(dt, False)
 
     def body_diff(self, dt: np.array) -> Points:
-        newqs = Quaternions.body_axis_rates(
-            self,
-            Quaternions(np.vstack([self.data[1:, :], self.data[-1, :]]))
-        ) / dt
-        return newqs.remove_outliers(2) # Bodge to get rid of phase jump
+        """body frame rates, the difference to the next sample over dt"""
+        return self._diff_rates(dt, True)
+
+    @staticmethod
+    def _stream_rates(chunks: Iterable[Tuple['Quaternions', np.ndarray]], rates, nstds, window):
+        filt = RollingOutlierFilter(nstds, window) if nstds is not None else None
+        last_q, last_dt = None, None
+        last_pair, last_pair_dt = None, None
+        for qs, dt in chunks:
+            if qs.count == 0:
+                continue
+            dt = np.broadcast_to(dt, (qs.count,))
+            if last_q is None:
+                q, d = qs.data, dt
+            else:
+                q, d = np.vstack([last_q, qs.data]), np.concatenate([last_dt, dt])
+            if len(q) > 1:
+                newqs = rates(Quaternions(q[:-1]), Quaternions(q[1:])) / d[:-1]
+                yield filt(newqs) if filt else newqs
+                last_pair, last_pair_dt = q[-2:], d[-2:-1]
+            last_q, last_dt = q[-1:], d[-1:]
+
+        if last_q is not None:
+            # the last sample repeats the rate before it, as in diff
+            if last_pair is None:
+                last_pair, last_pair_dt = np.vstack([last_q, last_q]), last_dt
+            newqs = rates(Quaternions(last_pair[:1]), Quaternions(last_pair[1:])) / last_pair_dt
+            yield filt(newqs) if filt else newqs
 
+    @staticmethod
+    def stream_diff(chunks: Iterable[Tuple['Quaternions', np.ndarray]], nstds=None, window=1000) -> Iterable[Points]:
+        """diff over an iterable of (Quaternions, dt) chunks, at bounded memory. The last sample of
+        each chunk is carried into the next, so the yielded chunks lag the input by one sample but
+        together match diff. nstds enables an outlier filter judged on the rolling statistics of
+        the last window samples (see RollingOutlierFilter)."""
+        return Quaternions._stream_rates(chunks, Quaternions.axis_rates, nstds, window)
+
+    @staticmethod
+    def stream_body_diff(chunks: Iterable[Tuple['Quaternions', np.ndarray]], nstds=None, window=1000) -> Iterable[Points]:
+        """body_diff over an iterable of (Quaternions, dt) chunks, see stream_diff"""
+        return Quaternions._stream_rates(chunks, Quaternions.body_axis_rates, nstds, window)
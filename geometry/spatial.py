@@ -0,0 +1,200 @@
+"""
+This program is free software: you can redistribute it and/or modify it under
+the terms of the GNU General Public License as published by the Free Software
+Foundation, either version 3 of the License, or (at your option) any later
+version.
+This program is distributed in the hope that it will be useful, but WITHOUT
+ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+FOR A PARTICULAR PURPOSE. See the GNU General Public License for more details.
+You should have received a copy of the GNU General Public License along with
+this program. If not, see <http://www.gnu.org/licenses/>.
+"""
+from geometry.point import Point
+from geometry.points import Points
+from geometry import pairwise
+from typing import Tuple, Union
+import numpy as np
+
+
+_MAX_CELLS = 2 ** 62
+# the most neighbouring cell ids looked up in one pass, queries * (2 * reach + 1) ** 3
+_CELL_BUDGET = 2 ** 20
+
+
+def _grid_shape(data: np.ndarray, origin: np.ndarray, cell_size: float) -> np.ndarray:
+    return np.floor((data.max(axis=0) - origin) / cell_size).astype(np.int64) + 1
+
+
+def _default_cell_size(data: np.ndarray, target: float = 8) -> float:
+    """a cell size giving roughly target points per occupied cell, found by doubling or
+    halving from the size that would suit uniformly spread points"""
+    extent = np.ptp(data, axis=0).max()
+    if extent == 0:
+        return 1.0
+    origin = data.min(axis=0)
+    size = extent / len(data) ** (1 / 3)
+    for _ in range(32):
+        shape = _grid_shape(data, origin, size)
+        if np.prod(shape.astype(float)) > _MAX_CELLS:
+            size *= 2
+            continue
+        cells = np.floor((data - origin) / size).astype(np.int64)
+        occupancy = len(data) / len(np.unique((cells[:, 0] * shape[1] + cells[:, 1]) * shape[2] + cells[:, 2]))
+        if occupancy > 2 * target and size > extent * 1e-6:
+            size /= 2
+        elif occupancy < target / 2:
+            size *= 2
+        else:
+            break
+    return size
+
+
+class SpatialIndex(object):
+    def __init__(self, points: Points, cell_size: float = None):
+        """A uniform grid over points for radius and nearest neighbour queries.
+        The points are sorted by cell, so a query only looks at the points in the cells
+        around it rather than the whole array.
+
+        Args:
+            points (Points): the points to index
+            cell_size (float, optional): the grid spacing, by default one that puts around
+                eight points in each occupied cell.
+        """
+        self.points = points
+        data = np.asarray(points.data, dtype=float)
+        self.origin = data.min(axis=0)
+        self.cell_size = _default_cell_size(data) if cell_size is None else cell_size
+        self.shape = _grid_shape(data, self.origin, self.cell_size)
+        if np.prod(self.shape.astype(float)) > _MAX_CELLS:
+            raise ValueError("cell_size {} is too small for the extent of the points".format(cell_size))
+
+        keys = self._keys(self._cells(data))
+        self.order = np.argsort(keys, kind='stable')
+        self.keys, self.starts = np.unique(keys[self.order], return_index=True)
+        self.ends = np.append(self.starts[1:], len(keys))
+
+    @property
+    def count(self):
+        return self.points.count
+
+    def _cells(self, data: np.ndarray) -> np.ndarray:
+        return np.floor((data - self.origin) / self.cell_size).astype(np.int64)
+
+    def _keys(self, cells: np.ndarray) -> np.ndarray:
+        return (cells[:, 0] * self.shape[1] + cells[:, 1]) * self.shape[2] + cells[:, 2]
+
+    def _candidates(self, queries: np.ndarray, reach: int) -> Tuple[np.ndarray, np.ndarray]:
+        """query and point index pairs for every point in the cells within reach cells of
+        each query"""
+        cells = self._cells(queries)
+        rng = np.arange(-reach, reach + 1)
+        offsets = np.stack(np.meshgrid(rng, rng, rng, indexing='ij'), axis=-1).reshape(-1, 3)
+
+        ncells = cells[:, np.newaxis, :] + offsets[np.newaxis, :, :]
+        valid = np.all((ncells >= 0) & (ncells < self.shape), axis=2)
+        qidx = np.nonzero(valid)[0]
+        keys = self._keys(ncells[valid])
+
+        pos = np.minimum(np.searchsorted(self.keys, keys), len(self.keys) - 1)
+        found = self.keys[pos] == keys
+        qidx, pos = qidx[found], pos[found]
+
+        lengths = self.ends[pos] - self.starts[pos]
+        total = lengths.sum()
+        flat = np.arange(total) - np.repeat(np.cumsum(lengths) - lengths, lengths) + \
+            np.repeat(self.starts[pos], lengths)
+        return np.repeat(qidx, lengths), self.order[flat]
+
+    def _brute(self, reach: int) -> bool:
+        """True if there are more cells around a query than occupied cells, in which case
+        comparing against every point is cheaper"""
+        return (2 * reach + 1) ** 3 >= len(self.keys)
+
+    @staticmethod
+    def _grid_chunk(reach: int) -> int:
+        """the number of queries whose neighbouring cells fit in _CELL_BUDGET"""
+        return max(1, _CELL_BUDGET // (2 * reach + 1) ** 3)
+
+    @staticmethod
+    def _as_array(points: Union[Point, Points]) -> np.ndarray:
+        if isinstance(points, Point):
+            return np.array([list(points)], dtype=float)
+        return np.asarray(points.data, dtype=float)
+
+    def query_radius(self, points: Union[Point, Points], radius: float, chunk: int = 4096) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """all the indexed points within radius of each query point, as flat arrays of
+        (query index, point index, distance) sorted by query and then distance. The queries
+        are processed chunk at a time to bound memory, fewer at once for large radii."""
+        queries = self._as_array(points)
+        data = self.points.data
+        reach = int(np.ceil(radius / self.cell_size))
+        if self._brute(reach):
+            # compared against every point in tiles of rows, so memory stays bounded
+            qidx, pidx, dist = pairwise.distances(
+                queries, np.asarray(data, dtype=float), threshold=radius)
+            order = np.lexsort((dist, qidx))
+            return qidx[order], pidx[order], dist[order]
+
+        chunk = min(chunk, self._grid_chunk(reach))
+        results = [(np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int64), np.empty(0))]
+        for i in range(0, len(queries), chunk):
+            q = queries[i:i + chunk]
+            qidx, pidx = self._candidates(q, reach)
+            dist = np.linalg.norm(data[pidx] - q[qidx], axis=1)
+            keep = dist <= radius
+            qidx, pidx, dist = qidx[keep], pidx[keep], dist[keep]
+            order = np.lexsort((dist, qidx))
+            results.append((qidx[order] + i, pidx[order], dist[order]))
+
+        return tuple(np.concatenate(res) for res in zip(*results))
+
+    def query(self, points: Union[Point, Points], k: int = 1, chunk: int = 4096) -> Tuple[np.ndarray, np.ndarray]:
+        """the k nearest indexed points to each query point. Returns (distances, indices),
+        both nquery * k and sorted nearest first. If there are fewer than k indexed points
+        the extra columns have infinite distance and index -1."""
+        queries = self._as_array(points)
+        dists = np.full((len(queries), k), np.inf)
+        idxs = np.full((len(queries), k), -1, dtype=np.int64)
+
+        for i in range(0, len(queries), chunk):
+            pending = np.arange(i, min(i + chunk, len(queries)))
+            reach = 1
+            while len(pending) > 0:
+                if self._brute(reach):
+                    self._brute_knn(queries, pending, dists, idxs)
+                    break
+                step = self._grid_chunk(reach)
+                pending = np.concatenate([
+                    self._grid_knn(queries, pending[j:j + step], reach, dists, idxs)
+                    for j in range(0, len(pending), step)])
+                reach *= 2
+
+        return dists, idxs
+
+    def _grid_knn(self, queries, pending, reach, dists, idxs) -> np.ndarray:
+        """fill in the queries whose k nearest neighbours are certain to be within reach
+        cells, returns the ones that aren't"""
+        k = dists.shape[1]
+        qidx, pidx = self._candidates(queries[pending], reach)
+        dist = np.linalg.norm(self.points.data[pidx] - queries[pending][qidx], axis=1)
+
+        # every point within this radius is in the cells searched, further ones might not be
+        keep = dist <= reach * self.cell_size
+        qidx, pidx, dist = qidx[keep], pidx[keep], dist[keep]
+
+        order = np.lexsort((dist, qidx))
+        qidx, pidx, dist = qidx[order], pidx[order], dist[order]
+        counts = np.bincount(qidx, minlength=len(pending))
+        rank = np.arange(len(qidx)) - np.repeat(np.cumsum(counts) - counts, counts)
+
+        done = counts >= k
+        take = (rank < k) & done[qidx]
+        dists[pending[qidx[take]], rank[take]] = dist[take]
+        idxs[pending[qidx[take]], rank[take]] = pidx[take]
+        return pending[~done]
+
+    def _brute_knn(self, queries, pending, dists, idxs):
+        """compare against every point, in tiles of rows so memory stays bounded"""
+        k = min(dists.shape[1], self.count)
+        dists[pending, :k], idxs[pending, :k] = pairwise.distances(
+            queries[pending], np.asarray(self.points.data, dtype=float), k=k)
@@ -0,0 +1,72 @@
+"""
+Binary storage for Points, Quaternions and time indexed bundles of them.
+
+A bundle is a single .npy file holding a structured array with one record per
+sample. The optional field 't' holds the sample times, fields with a sub array
+shape of (3,) are loaded as Points, (4,) as Quaternions and anything else as a
+plain np.ndarray. The files are opened with np.memmap, so nothing is read until
+it is used, and a time window only touches the records inside it.
+"""
+from geometry.points import Points
+from geometry.quaternions import Quaternions
+from typing import Dict, Union
+import numpy as np
+
+
+def _field_data(series) -> np.ndarray:
+    if isinstance(series, (Points, Quaternions)):
+        return series.data
+    return np.asarray(series)
+
+
+def save(path: str, t: np.ndarray = None, **series):
+    """save a bundle of equal length series, ie save('flight.npy', t, pos=pnts, att=quats)"""
+    if t is not None:
+        series = dict(t=t, **series)
+    if len(series) == 0:
+        raise ValueError("nothing to save")
+    arrays = {name: _field_data(s) for name, s in series.items()}
+
+    count = len(next(iter(arrays.values())))
+    for name, arr in arrays.items():
+        if not len(arr) == count:
+            raise ValueError("{} has {} samples, expected {}".format(name, len(arr), count))
+
+    dtype = np.dtype([(name, arr.dtype, arr.shape[1:]) for name, arr in arrays.items()])
+    out = np.lib.format.open_memmap(path, mode='w+', dtype=dtype, shape=(count,))
+    for name, arr in arrays.items():
+        out[name] = arr
+    out.flush()
+    del out
+
+
+def time_window(t: np.ndarray, t0: float = None, t1: float = None) -> slice:
+    """slice of the monotonic times t that fall within t0 <= t < t1"""
+    start = 0 if t0 is None else np.searchsorted(t, t0, side='left')
+    stop = len(t) if t1 is None else np.searchsorted(t, t1, side='left')
+    return slice(int(start), int(stop))
+
+
+def load(path: str, t0: float = None, t1: float = None, mmap_mode: str = 'r') -> Dict[str, Union[np.ndarray, Points, Quaternions]]:
+    """load a bundle saved with save, optionally only the samples within t0 <= t < t1.
+    With the default mmap_mode the returned data are read only views of the file."""
+    data = np.load(path, mmap_mode=mmap_mode)
+    if data.dtype.names is None:
+        raise ValueError("{} is not a bundle".format(path))
+
+    if t0 is not None or t1 is not None:
+        if 't' not in data.dtype.names:
+            raise ValueError("{} has no time field".format(path))
+        data = data[time_window(data['t'], t0, t1)]
+
+    bundle = {}
+    for name in data.dtype.names:
+        field = data[name]
+        shape = data.dtype.fields[name][0].shape
+        if shape == (3,):
+            bundle[name] = Points(field)
+        elif shape == (4,):
+            bundle[name] = Quaternions(field)
+        else:
+            bundle[name] = field
+    return bundle
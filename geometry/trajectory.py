@@ -0,0 +1,126 @@
+"""
+This program is free software: you can redistribute it and/or modify it under
+the terms of the GNU General Public License as published by the Free Software
+Foundation, either version 3 of the License, or (at your option) any later
+version.
+This program is distributed in the hope that it will be useful, but WITHOUT
+ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+FOR A PARTICULAR PURPOSE. See the GNU General Public License for more details.
+You should have received a copy of the GNU General Public License along with
+this program. If not, see <http://www.gnu.org/licenses/>.
+"""
+from geometry.points import Points
+from geometry.quaternions import Quaternions
+from geometry import storage
+import numpy as np
+
+
+def _forward_dt(t: np.ndarray) -> np.ndarray:
+    """the time from each sample to the next, the last repeats the one before as the rates do"""
+    dt = np.diff(t)
+    return np.append(dt, dt[-1:])
+
+
+class _derived(object):
+    """a value calculated from the samples when first used and then kept in the instance
+    __dict__, as functools.cached_property (python >= 3.8). On a slice of a trajectory it is
+    the slice of the parent's value, so a window gives the same values however it was made."""
+    def __init__(self, func):
+        self.func = func
+        self.name = func.__name__
+        self.__doc__ = func.__doc__
+
+    def __get__(self, traj, owner=None):
+        if traj is None:
+            return self
+        if self.name not in traj.__dict__:
+            if traj._parent is None:
+                value = self.func(traj)
+            else:
+                value = getattr(traj._parent, self.name)
+                value = value[traj._slice] if isinstance(value, np.ndarray) \
+                    else Points(value.data[traj._slice])
+            traj.__dict__[self.name] = value
+        return traj.__dict__[self.name]
+
+
+class Trajectory(object):
+    def __init__(self, t: np.ndarray, pos: Points, att: Quaternions = None):
+        """A flight path with its sample times. The derived values (dt, step, vel, acc, rates,
+        body_rates) are calculated when they are first used and then kept, a slice takes
+        them from the trajectory it was cut from. dt is the central difference spacing used
+        for vel and acc, step the forward spacing used for the rates.
+
+        Args:
+            t (np.ndarray): monotonic sample times
+            pos (Points): the position at each time
+            att (Quaternions, optional): the attitude at each time
+        """
+        if not pos.count == len(t) or (att is not None and not att.count == len(t)):
+            raise ValueError("t, pos and att must have the same length")
+        self.t = t
+        self.pos = pos
+        self.att = att
+        self._parent = None
+        self._slice = None
+
+    @property
+    def count(self):
+        return len(self.t)
+
+    @_derived
+    def dt(self) -> np.ndarray:
+        return np.gradient(self.t)
+
+    @_derived
+    def step(self) -> np.ndarray:
+        return _forward_dt(self.t)
+
+    @_derived
+    def vel(self) -> Points:
+        return self.pos.diff(self.dt)
+
+    @_derived
+    def acc(self) -> Points:
+        return self.vel.diff(self.dt)
+
+    @_derived
+    def rates(self) -> Points:
+        return self._attitude().diff(self.step)
+
+    @_derived
+    def body_rates(self) -> Points:
+        return self._attitude().body_diff(self.step)
+
+    def _attitude(self) -> Quaternions:
+        if self.att is None:
+            raise ValueError("this trajectory has no attitude")
+        return self.att
+
+    def __getitem__(self, sli: slice):
+        """a trajectory of views on the sliced samples, its derived values are slices of
+        those of the whole trajectory"""
+        if not isinstance(sli, slice):
+            raise TypeError("Trajectories can only be sliced")
+        traj = Trajectory(
+            self.t[sli],
+            Points(self.pos.data[sli]),
+            None if self.att is None else Quaternions(self.att.data[sli])
+        )
+        traj._parent, traj._slice = self, sli
+        return traj
+
+    def window(self, t0: float = None, t1: float = None):
+        """the samples within t0 <= t < t1, found by binary search"""
+        return self[storage.time_window(self.t, t0, t1)]
+
+    def to_npy(self, path: str):
+        if self.att is None:
+            storage.save(path, self.t, pos=self.pos)
+        else:
+            storage.save(path, self.t, pos=self.pos, att=self.att)
+
+    @staticmethod
+    def from_npy(path: str, t0: float = None, t1: float = None, mmap_mode: str = 'r'):
+        bundle = storage.load(path, t0, t1, mmap_mode)
+        return Trajectory(bundle['t'], bundle['pos'], bundle.get('att'))
@@ -1,4 +1,5 @@
 from . import Point, Quaternion, Coord, Points, Quaternions
+from .points import _as_float
 
 import numpy as np
 from typing import Union
@@ -24,7 +25,7 @@ class Transformation():
         if isinstance(point, Point):
             return self.rotation.transform_point(point)
         elif isinstance(point, Points):
-            return Quaternions.from_quaternion(self.rotation, point.count).transform_point(point)
+            return Quaternions(np.array([list(self.rotation)], dtype=_as_float(point.data).dtype)).transform_point(point)
         else:
             return NotImplemented
 
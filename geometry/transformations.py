@@ -0,0 +1,84 @@
+from . import Point, Quaternion, Points, Quaternions, Coords, Transformation
+
+import numpy as np
+from typing import Union
+
+
+class Transformations():
+    def __init__(self, translation: Points, rotation: Quaternions):
+        """n translations and rotations, a single row of either is applied to every sample"""
+        self.translation = translation
+        self.rotation = rotation
+
+    @property
+    def count(self):
+        return max(self.translation.count, self.rotation.count)
+
+    def __getitem__(self, i) -> Transformation:
+        return Transformation(
+            Point(*self.translation.data[i]),
+            Quaternion(*self.rotation.data[i])
+        )
+
+    @staticmethod
+    def from_transformation(transform: Transformation):
+        return Transformations(
+            Points(np.array([list(transform.translation)])),
+            Quaternions(np.array([list(transform.rotation)]))
+        )
+
+    @staticmethod
+    def from_transformations(transforms: list):
+        return Transformations(
+            Points(np.array([list(t.translation) for t in transforms])),
+            Quaternions(np.array([list(t.rotation) for t in transforms]))
+        )
+
+    @staticmethod
+    def from_coords(coord_a: Coords, coord_b: Coords):
+        return Transformations(
+            coord_b.origin - coord_a.origin,
+            Quaternions.from_rotation_matrix(
+                np.matmul(
+                    coord_b.inverse_rotation_matrix,
+                    coord_a.rotation_matrix
+                ))
+        )
+
+    def rotate(self, point: Union[Point, Points]):
+        return self.rotation.transform_point(point)
+
+    def translate(self, point: Union[Point, Points]):
+        return point + self.translation
+
+    def point(self, point: Union[Point, Points]):
+        return self.translate(self.rotate(point))
+
+    def quat(self, quat: Union[Quaternion, Quaternions]):
+        return self.rotation * quat
+
+    def coord(self, coord: Coords = None):
+        if coord is None:
+            coord = Coords.from_nothing(self.count)
+        return coord.translate(self.translation).rotate(
+            self.rotation.to_rotation_matrix()
+        )
+
+    def inverse(self):
+        rotation = self.rotation.inverse()
+        return Transformations(
+            -rotation.transform_point(self.translation),
+            rotation
+        )
+
+    def __mul__(self, other):
+        """compose, (self * other).point(p) == self.point(other.point(p))"""
+        if isinstance(other, Transformation):
+            other = Transformations.from_transformation(other)
+        if isinstance(other, Transformations):
+            return Transformations(
+                self.point(other.translation),
+                self.rotation * other.rotation
+            )
+        else:
+            return NotImplemented
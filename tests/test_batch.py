@@ -0,0 +1,93 @@
+import unittest
+import os
+import tempfile
+from unittest import mock
+from geometry import batch
+from geometry import GPSPosition, Points, Quaternions, Transformation, Point, Quaternion, storage
+from geometry.batch import GeometryPipeline, run_batch
+import numpy as np
+
+
+class FailingPipeline(object):
+    def __call__(self, log):
+        raise RuntimeError("bad log")
+
+
+class TestBatch(unittest.TestCase):
+    def setUp(self):
+        self.dir = tempfile.TemporaryDirectory()
+        self.logs = []
+        for i in range(4):
+            t = np.linspace(0, 10, 200 + i)
+            self.logs.append(dict(
+                t=t,
+                gps=np.column_stack([
+                    51.459387 + np.random.random(len(t)) * 0.001,
+                    -2.791393 + np.random.random(len(t)) * 0.001
+                ]),
+                att=Quaternions.from_euler(Points(np.column_stack([
+                    t * 0.1, np.zeros(len(t)), np.zeros(len(t))]))).data
+            ))
+        self.pipeline = GeometryPipeline(
+            GPSPosition(51.459387, -2.791393),
+            Transformation(Point(1, 2, 3), Quaternion.from_euler(Point(0, 0, 1)))
+        )
+
+    def tearDown(self):
+        self.dir.cleanup()
+
+    def check(self, paths):
+        self.assertEqual(len(paths), len(self.logs))
+        for path, log in zip(paths, self.logs):
+            result = storage.load(path)
+            expected = self.pipeline(log)
+            for name in ['pos', 'att', 'body_rates']:
+                np.testing.assert_array_equal(result[name].data, expected[name].data)
+            np.testing.assert_array_equal(result['t'], log['t'])
+            del result
+
+    def test_arrays(self):
+        self.check(run_batch(self.logs, self.pipeline, os.path.join(self.dir.name, 'out'), 2))
+
+    def test_files(self):
+        paths = []
+        for i, log in enumerate(self.logs):
+            paths.append(os.path.join(self.dir.name, 'log{}.npy'.format(i)))
+            storage.save(paths[-1], **log)
+        results = run_batch(paths, self.pipeline, os.path.join(self.dir.name, 'out'), 2)
+        self.assertEqual(os.path.basename(results[0]), '000000_log0.npy')
+        self.check(results)
+
+    def test_same_names(self):
+        paths = []
+        for i, log in enumerate(self.logs):
+            folder = os.path.join(self.dir.name, str(i))
+            os.makedirs(folder)
+            paths.append(os.path.join(folder, 'flight.npy'))
+            storage.save(paths[-1], **log)
+        results = run_batch(paths, self.pipeline, os.path.join(self.dir.name, 'out'), 2)
+        self.assertEqual(len(set(results)), len(paths))
+        self.check(results)
+
+    def test_failure_releases_shared_memory(self):
+        before = set(os.listdir('/dev/shm'))
+        with self.assertRaises(RuntimeError):
+            run_batch(self.logs * 3, FailingPipeline(), os.path.join(self.dir.name, 'out'), 2)
+        self.assertEqual(set(os.listdir('/dev/shm')) - before, set())
+
+    def test_without_shared_memory(self):
+        with mock.patch.object(batch, 'shared_memory', None):
+            self.check(run_batch(self.logs, self.pipeline, os.path.join(self.dir.name, 'out'), 2))
+
+    def test_altitude(self):
+        log = dict(self.logs[0])
+        log['gps'] = np.column_stack([log['gps'], np.linspace(120, 150, len(log['t']))])
+        pos = GeometryPipeline()(log)['pos']
+        np.testing.assert_array_equal(pos.data[0], np.zeros(3))
+        np.testing.assert_array_almost_equal(pos.z, 120 - log['gps'][:, 2])
+
+        home = GPSPosition(log['gps'][0, 0], log['gps'][0, 1], 100)
+        np.testing.assert_array_almost_equal(
+            GeometryPipeline(home)(log)['pos'].z, 100 - log['gps'][:, 2])
+        with self.assertRaises(ValueError):
+            GeometryPipeline(GPSPosition(51.459387, -2.791393))(log)
@@ -0,0 +1,68 @@
+import unittest
+from geometry import Coord, Coords, Point, Points
+import numpy as np
+
+
+class TestCoords(unittest.TestCase):
+    def setUp(self):
+        self.coord_list = [
+            Coord.from_xy(Point(*o), Point(*x), Point(*y))
+            for o, x, y in np.random.random((20, 3, 3))
+        ]
+        self.coords = Coords.from_coords(self.coord_list)
+
+    def assert_coords_equal(self, coords, coord_list):
+        for i, coord in enumerate(coord_list):
+            np.testing.assert_array_almost_equal(coords.origin.data[i], list(coord.origin))
+            np.testing.assert_array_almost_equal(coords.rotation_matrix[i], coord.rotation_matrix)
+
+    def test_from_xy(self):
+        origin, x_axis, y_axis = [Points(d) for d in np.random.random((3, 20, 3))]
+        self.assert_coords_equal(
+            Coords.from_xy(origin, x_axis, y_axis),
+            [Coord.from_xy(Point(*o), Point(*x), Point(*y))
+             for o, x, y in zip(origin.data, x_axis.data, y_axis.data)]
+        )
+
+    def test_getitem(self):
+        self.assertEqual(self.coords.count, 20)
+        np.testing.assert_array_almost_equal(
+            self.coords[3].rotation_matrix,
+            self.coord_list[3].rotation_matrix
+        )
+
+    def test_inverse_rotation_matrix(self):
+        np.testing.assert_array_almost_equal(
+            self.coords.inverse_rotation_matrix,
+            np.array([coord.inverse_rotation_matrix for coord in self.coord_list])
+        )
+
+    def test_rotate(self):
+        rmat = Point(0.7, -1.2, 1).to_rotation_matrix()
+        self.assert_coords_equal(
+            self.coords.rotate(rmat),
+            [coord.rotate(rmat) for coord in self.coord_list]
+        )
+
+    def test_euler_rotation(self):
+        angles = Points(np.random.random((20, 3)))
+        self.assert_coords_equal(
+            self.coords.euler_rotation(angles),
+            [coord.euler_rotation(Point(*eul))
+             for coord, eul in zip(self.coord_list, angles.data)]
+        )
+
+    def test_translate(self):
+        self.assert_coords_equal(
+            self.coords.translate(Point(1, 2, 3)),
+            [coord.translate(Point(1, 2, 3)) for coord in self.coord_list]
+        )
+
+    def test_get_plot_df(self):
+        df = self.coords.get_plot_df(5)
+        expected = self.coord_list[1].get_plot_df(5)
+        np.testing.assert_array_almost_equal(
+            df.iloc[9:18][list('xyz')].to_numpy(),
+            expected[list('xyz')].to_numpy()
+        )
+        np.testing.assert_array_equal(df.iloc[9:18]['c'], expected['c'])
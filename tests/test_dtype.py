@@ -0,0 +1,107 @@
+import unittest
+from geometry import Point, Points, Quaternion, Quaternions, GPSPosition, GPSPositions, Transformation
+from geometry.parallel import ChunkExecutor
+import numpy as np
+
+
+class TestDtype(unittest.TestCase):
+    def setUp(self):
+        rng = np.random.default_rng(0)
+        self.pnts = Points(rng.random((100, 3)).astype(np.float32))
+        self.other = Points(rng.random((100, 3)).astype(np.float32))
+        self.quats = Quaternions.from_euler(self.pnts)
+        self.dt = np.full(100, 0.01)
+
+    def check(self, result):
+        data = result.data if isinstance(result, (Points, Quaternions)) else result
+        self.assertEqual(data.dtype, np.float32)
+
+    def test_points(self):
+        p, o = self.pnts, self.other
+        self.check(p + o)
+        self.check(p - o)
+        self.check(p * o)
+        self.check(p / o)
+        self.check(p + Point(1, 2, 3))
+        self.check(Point(1, 2, 3) - p)
+        self.check(p * Point(1, 2, 3))
+        self.check(p * 2.0)
+        self.check(p * np.float64(2))
+        self.check(p * np.ones(100))
+        self.check(p / np.ones(100))
+        self.check(p / np.float64(2))
+        self.check(-p)
+        self.check(abs(p))
+        self.check(p.unit())
+        self.check(p.scale(np.float64(2)))
+        self.check(p.dot(o))
+        self.check(p.cross(o))
+        self.check(p.diff(self.dt))
+        self.check(p.to_rotation_matrix())
+        self.check(p.remove_outliers())
+
+    def test_quaternions(self):
+        q = self.quats
+        self.check(q)
+        self.check(q * q)
+        self.check(q * Quaternion(1, 0, 0, 0))
+        self.check(Quaternion(1, 0, 0, 0) * q)
+        self.check(q * 2.0)
+        self.check(q * np.ones(100))
+        self.check(q.conjugate())
+        self.check(q.inverse())
+        self.check(q.norm())
+        self.check(q.transform_point(self.pnts))
+        self.check(q.transform_point(Point(1, 2, 3)))
+        self.check(q.to_axis_angle())
+        self.check(q.to_euler())
+        self.check(q.to_euler('ZXZ', unwrap=True))
+        self.check(q.to_rotation_matrix())
+        self.check(Quaternions.from_rotation_matrix(q.to_rotation_matrix()))
+        self.check(Quaternions.from_axis_angle(self.pnts))
+        self.check(q.continuous())
+        self.check(q.resample(np.arange(100.0), np.linspace(0, 99, 250)))
+        self.check(q.resample(np.arange(100.0), np.linspace(0, 99, 250), 'squad'))
+        self.check(q.diff(self.dt))
+        self.check(q.body_diff(self.dt))
+
+    def test_transformation(self):
+        t = Transformation(Point(1, 2, 3), Quaternion.from_euler(Point(0, 0, 1)))
+        self.check(t.point(self.pnts))
+
+    def test_gps(self):
+        gps = GPSPositions(np.array([[51.459387, -2.791393], [51.46, -2.79]], dtype=np.float32))
+        self.check(gps.ned_from(GPSPosition(51.459387, -2.791393)))
+
+    def test_parallel(self):
+        ex = ChunkExecutor(2, min_chunk=10)
+        self.check(ex.transform_point(self.quats, self.pnts))
+        self.check(ex.from_axis_angle(self.pnts))
+        self.check(ex.diff(self.quats, self.dt))
+
+    def test_dtype_argument(self):
+        pnts = Points(np.ones((10, 3)))
+        self.assertEqual(Quaternions.from_euler(pnts, np.float32).dtype, np.float32)
+        self.assertEqual(Quaternions.from_axis_angle(pnts, dtype=np.float32).dtype, np.float32)
+        self.assertEqual(Quaternions.from_rotation_matrix(
+            pnts.to_rotation_matrix(), np.float32).dtype, np.float32)
+        self.assertEqual(Points.from_point(Point(1, 2, 3), 10, np.float32).dtype, np.float32)
+        self.assertEqual(Quaternions.from_quaternion(
+            Quaternion(1, 0, 0, 0), 10, np.float32).dtype, np.float32)
+
+    def test_integer_input(self):
+        pnts = Points(np.ones((10, 3), dtype=int))
+        self.assertEqual(Quaternions.from_euler(pnts).dtype, np.float64)
+        self.assertEqual(Quaternions.from_axis_angle(pnts).dtype, np.float64)
+
+    def test_integer_rotation(self):
+        pnts = Points(np.array([[1, 0, 0]]))
+        t = Transformation(Point(0, 0, 0), Quaternion.from_euler(Point(0, 0, np.pi / 2)))
+        np.testing.assert_array_almost_equal(t.rotate(pnts).data, [[0, 1, 0]])
+
+        q = Quaternion.from_euler(Point(0, 0, np.pi / 2))
+        iquats = Quaternions(np.array([[1, 0, 0, 0]]))
+        np.testing.assert_array_almost_equal((iquats * q).data, [list(q)])
+        np.testing.assert_array_almost_equal((q * iquats).data, [list(q)])
+        np.testing.assert_array_almost_equal(
+            iquats.transform_point(Point(0.5, 0.25, 0)).data, [[0.5, 0.25, 0]])
@@ -0,0 +1,55 @@
+import unittest
+from geometry.gps import GPSPosition, GPSPositions
+from geometry import Points
+import numpy as np
+
+
+class TestGPSPositions(unittest.TestCase):
+    def setUp(self):
+        self.home = GPSPosition(51.459387, -2.791393)
+        self.data = np.column_stack([
+            51.459387 + (np.random.random(100) - 0.5) * 0.01,
+            -2.791393 + (np.random.random(100) - 0.5) * 0.01,
+            np.random.random(100) * 100
+        ])
+
+    def test_ned_from(self):
+        np.testing.assert_array_equal(
+            GPSPositions(self.data[:, :2]).ned_from(self.home).data,
+            np.array(np.vectorize(
+                lambda *args: tuple(self.home - GPSPosition(*args))
+            )(*self.data[:, :2].T)).T
+        )
+
+    def test_rsub(self):
+        pnts = self.home - GPSPositions(self.data[:, :2])
+        self.assertIsInstance(pnts, Points)
+        self.assertEqual(pnts.count, 100)
+
+    def test_altitude(self):
+        pnts = GPSPositions(self.data).ned_from(self.home, 10)
+        np.testing.assert_array_equal(pnts.z, 10 - self.data[:, 2])
+
+    def test_sub(self):
+        gps = GPSPositions(self.data)
+        np.testing.assert_array_almost_equal(
+            (gps - gps).data,
+            np.zeros((100, 3))
+        )
+
+    def test_home_altitude(self):
+        gps = GPSPositions(self.data)
+        with self.assertRaises(ValueError):
+            self.home - gps
+        home = GPSPosition(51.459387, -2.791393, 10)
+        np.testing.assert_array_equal((home - gps).z, 10 - self.data[:, 2])
+        np.testing.assert_array_equal(gps.ned_from(gps[0]).data[0], np.zeros(3))
+        self.assertEqual(gps[0].altitude, self.data[0, 2])
+
+    def test_scalar_altitude(self):
+        self.assertEqual((GPSPosition(51, -2, 10) - GPSPosition(51, -2, 25)).z, -15)
+        self.assertEqual((GPSPosition(51, -2) - GPSPosition(51, -2, 25)).z, 0)
+
+    def test_sub_mixed_altitude(self):
+        with self.assertRaises(ValueError):
+            GPSPositions(self.data) - GPSPositions(self.data[:, :2])
@@ -0,0 +1,34 @@
+import unittest
+import os
+import subprocess
+import sys
+
+# seconds allowed for a cold "import geometry", numpy included
+IMPORT_BUDGET = float(os.environ.get('GEOMETRY_IMPORT_BUDGET', 1.0))
+
+SCRIPT = """
+import sys, time
+t = time.perf_counter()
+import geometry
+print(time.perf_counter() - t)
+print(','.join(m for m in ['pandas', 'scipy', 'matplotlib'] if m in sys.modules))
+"""
+
+
+class TestImport(unittest.TestCase):
+    def run_import(self):
+        result = subprocess.run(
+            [sys.executable, '-c', SCRIPT],
+            cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+            capture_output=True, text=True, check=True
+        )
+        duration, modules = result.stdout.splitlines()
+        return float(duration), modules
+
+    def test_lazy_dependencies(self):
+        self.assertEqual(self.run_import()[1], '')
+
+    def test_import_time(self):
+        # best of a few runs to keep scheduling noise out of it
+        duration = min(self.run_import()[0] for _ in range(3))
+        self.assertLess(duration, IMPORT_BUDGET)
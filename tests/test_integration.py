@@ -0,0 +1,77 @@
+import unittest
+from geometry import AttitudeIntegrator, Points, Quaternions, Quaternion
+import numpy as np
+
+
+class TestAttitudeIntegrator(unittest.TestCase):
+    def setUp(self):
+        self.t = np.linspace(0, 10, 1001)
+        self.dt = np.gradient(self.t)
+        self.qs = Quaternions.from_euler(Points(np.column_stack([
+            np.sin(self.t), np.cos(0.5 * self.t), self.t * 0.3])))
+        self.q0 = Quaternion(*self.qs.data[0])
+
+    def assertSameRotations(self, a, b, decimal=12):
+        np.testing.assert_array_almost_equal(
+            np.abs(np.einsum('ij,ij->i', a.data, b.data)), np.ones(a.count), decimal)
+
+    def test_diff_roundtrip(self):
+        self.assertSameRotations(AttitudeIntegrator.integrate(
+            self.qs.body_diff(self.dt), self.dt, self.q0), self.qs)
+        self.assertSameRotations(AttitudeIntegrator.integrate(
+            self.qs.diff(self.dt), self.dt, self.q0, frame='world'), self.qs)
+
+    def test_stream(self):
+        rates = self.qs.body_diff(self.dt)
+        for scheme in ['exp', 'rk4', 'coning']:
+            expected = AttitudeIntegrator.integrate(rates, self.dt, self.q0, scheme)
+            integrator = AttitudeIntegrator(self.q0, scheme)
+            chunks = [
+                integrator(Points(rates.data[i:i + 97]), self.dt[i:i + 97]).data
+                for i in range(0, 1001, 97)
+            ]
+            np.testing.assert_array_almost_equal(np.vstack(chunks), expected.data, 14)
+            np.testing.assert_array_equal(list(integrator.attitude), chunks[-1][-1])
+
+    def test_rk4(self):
+        # rate increasing linearly about z, the angle is the integral of the rate
+        t = np.linspace(0, 1, 101)
+        rates = Points(np.column_stack([np.zeros(101), np.zeros(101), 2 * t]))
+        angles = t ** 2
+        for scheme, decimal in [('rk4', 10), ('exp', 2)]:
+            qs = AttitudeIntegrator.integrate(rates, 0.01, scheme=scheme)
+            np.testing.assert_array_almost_equal(qs.to_axis_angle().z, angles, decimal)
+
+    def test_coning(self):
+        # delta angle rates from a coning motion integrated at 100 times the rate
+        sub = 100
+        t = np.arange(200 * sub) * 0.01 / sub
+        fine = Points(np.column_stack([np.cos(10 * t), np.sin(10 * t), np.zeros(len(t))]))
+        truth = AttitudeIntegrator.integrate(fine, 0.01 / sub)
+
+        rates = Points(fine.data.reshape(200, sub, 3).mean(axis=1))
+        errors = {}
+        for scheme in ['exp', 'coning']:
+            qs = AttitudeIntegrator.integrate(rates, 0.01, scheme=scheme)
+            errors[scheme] = np.max(np.abs(
+                (qs.conjugate() * Quaternions(truth.data[::sub])).to_axis_angle().data))
+        self.assertLess(errors['coning'], errors['exp'] / 10)
+
+    def test_renormalize(self):
+        rates = Points(np.random.random((5000, 3)))
+        qs = AttitudeIntegrator.integrate(rates, 0.001, scheme='rk4')
+        np.testing.assert_array_almost_equal(abs(qs), np.ones(5000), 14)
+
+    def test_float32(self):
+        rates = Points(np.random.random((100, 3)).astype(np.float32))
+        self.assertEqual(AttitudeIntegrator.integrate(rates, 0.01).dtype, np.float32)
+
+    def test_unknown(self):
+        with self.assertRaises(ValueError):
+            AttitudeIntegrator(scheme='euler')
+        with self.assertRaises(ValueError):
+            AttitudeIntegrator(frame='ned')
+
+
+if __name__ == "__main__":
+    unittest.main()
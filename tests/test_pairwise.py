@@ -0,0 +1,62 @@
+import unittest
+from geometry import Points, Point
+from geometry.point import angle_between, is_parallel, is_perpendicular
+import numpy as np
+
+
+class TestPairwise(unittest.TestCase):
+    def setUp(self):
+        rng = np.random.default_rng(0)
+        self.a = Points(rng.random((50, 3)) - 0.5)
+        self.b = Points(rng.random((70, 3)) - 0.5)
+
+    def test_distance_matrix(self):
+        expected = np.linalg.norm(self.a.data[:, np.newaxis, :] - self.b.data[np.newaxis, :, :], axis=2)
+        np.testing.assert_array_almost_equal(self.a.distance_matrix(self.b), expected, 14)
+        np.testing.assert_array_almost_equal(self.a.distance_matrix(self.b, tile=7), expected, 14)
+        np.testing.assert_array_equal(np.diag(self.a.distance_matrix()), np.zeros(50))
+
+    def test_angle_matrix(self):
+        expected = np.array([[angle_between(Point(*p), Point(*q)) for q in self.b.data] for p in self.a.data])
+        np.testing.assert_array_almost_equal(self.a.angle_matrix(self.b, tile=9), expected)
+        np.testing.assert_array_almost_equal(self.a.cosine_matrix(self.b), np.cos(expected))
+
+    def test_top_k(self):
+        full = self.a.distance_matrix(self.b)
+        values, indices = self.a.distance_matrix(self.b, k=5, tile=8)
+        np.testing.assert_array_equal(indices, np.argsort(full, axis=1, kind='stable')[:, :5])
+        np.testing.assert_array_equal(values, np.sort(full, axis=1)[:, :5])
+
+        full = self.a.cosine_matrix(self.b)
+        values, indices = self.a.cosine_matrix(self.b, k=3)
+        np.testing.assert_array_equal(values, -np.sort(-full, axis=1)[:, :3])
+
+        values, indices = self.a.distance_matrix(self.b, k=100)
+        self.assertEqual(values.shape, (50, 70))
+
+    def test_threshold(self):
+        full = self.a.distance_matrix(self.b)
+        rows, cols, values = self.a.distance_matrix(self.b, threshold=0.3, tile=6)
+        np.testing.assert_array_equal(np.column_stack([rows, cols]), np.argwhere(full <= 0.3))
+        np.testing.assert_array_equal(values, full[full <= 0.3])
+
+        rows, cols, values = self.a.distance_matrix(self.b, threshold=-1)
+        self.assertEqual(len(rows), 0)
+
+    def test_masks(self):
+        pnts = Points(np.array([[1, 0, 0], [-2, 0, 0], [0, 1, 0], [0, 0, 3], [1, 1, 0], [0, 0, 0]], dtype=float))
+        parallel = pnts.parallel_mask()
+        perpendicular = pnts.perpendicular_mask()
+        for i in range(5):
+            for j in range(5):
+                p, q = Point(*pnts.data[i]), Point(*pnts.data[j])
+                self.assertEqual(parallel[i, j], is_parallel(p, q))
+                self.assertEqual(perpendicular[i, j], is_perpendicular(p, q))
+        self.assertFalse(np.any(parallel[5]) or np.any(perpendicular[:, 5]))
+
+        rows, cols = pnts.parallel_mask(sparse=True, tile=2)
+        np.testing.assert_array_equal(np.column_stack([rows, cols]), np.argwhere(parallel))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,40 @@
+import unittest
+from geometry import Points, Quaternions, Point
+from geometry.parallel import ChunkExecutor
+import numpy as np
+
+
+class TestChunkExecutor(unittest.TestCase):
+    def setUp(self):
+        self.executor = ChunkExecutor(workers=4, min_chunk=100)
+        self.qs = Quaternions.from_euler(Points(np.cumsum(np.random.random((1001, 3)) * 0.1, axis=0)))
+        self.pnts = Points(np.random.random((1001, 3)))
+
+    def tearDown(self):
+        self.executor.shutdown()
+
+    def test_ranges(self):
+        self.assertEqual(self.executor.ranges(1001), [(0, 250), (250, 500), (500, 750), (750, 1001)])
+        self.assertEqual(self.executor.ranges(150), [(0, 150)])
+
+    def test_transform_point(self):
+        np.testing.assert_array_equal(
+            self.executor.transform_point(self.qs, self.pnts).data,
+            self.qs.transform_point(self.pnts).data
+        )
+        np.testing.assert_array_equal(
+            self.executor.transform_point(self.qs, Point(1, 2, 3)).data,
+            self.qs.transform_point(Point(1, 2, 3)).data
+        )
+
+    def test_from_axis_angle(self):
+        np.testing.assert_array_equal(
+            self.executor.from_axis_angle(self.pnts, 0.5).data,
+            Quaternions.from_axis_angle(self.pnts, 0.5).data
+        )
+
+    def test_diff(self):
+        dt = np.full(1001, 0.1)
+        np.testing.assert_array_equal(self.executor.diff(self.qs, dt).data, self.qs.diff(dt).data)
+        np.testing.assert_array_equal(
+            self.executor.body_diff(self.qs, dt).data, self.qs.body_diff(dt).data)
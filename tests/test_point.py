@@ -123,4 +123,12 @@ class TestPoint(unittest.TestCase):
         self.assertEqual(dot_product(Point(1,1,1), Point(1,1,1)), 3)
 
     def test_eq(self):
-        self.assertNotEqual(Point(1,1,1), None)
\ No newline at end of file
+        self.assertNotEqual(Point(1,1,1), None)
+
+    def test_slots(self):
+        with self.assertRaises(AttributeError):
+            Point(1, 2, 3).w = 1
+        self.assertEqual(Point(1, 2, 3).__dict__(), {'x': 1, 'y': 2, 'z': 3})
+
+    def test_neg(self):
+        self.assertEqual(-Point(1, -2, 3), Point(-1, 2, -3))
@@ -6,6 +6,8 @@ import numpy as np
 import pandas as pd
 
 from geometry import Point, dot_product, cross_product
+from geometry import point as pt
+from geometry.points import is_zero, RollingOutlierFilter
 
 
 class TestPoints(unittest.TestCase):
@@ -135,6 +137,42 @@ class TestPoints(unittest.TestCase):
                          )(*self.points.T)
         )
 
+    def test_point_broadcast(self):
+        pnts = Points(np.random.random((100, 3)))
+        p = Point(1, 2, 3)
+        tiled = Points.from_point(p, 100)
+        np.testing.assert_array_equal((pnts + p).data, (pnts + tiled).data)
+        np.testing.assert_array_equal((pnts - p).data, (pnts - tiled).data)
+        np.testing.assert_array_equal((p - pnts).data, (tiled - pnts).data)
+        np.testing.assert_array_equal((pnts + Points(np.array([list(p)]))).data, (pnts + tiled).data)
+
+    def test_unit_out(self):
+        pnts = Points(np.random.random((100, 3)))
+        expected = pnts.unit().data
+        out = Points(np.empty((100, 3)))
+        self.assertIs(pnts.unit(out), out)
+        np.testing.assert_array_equal(out.data, expected)
+        self.assertIs(pnts.normalize_(), pnts)
+        np.testing.assert_array_equal(pnts.data, expected)
+
+    def test_inplace(self):
+        data = np.random.random((100, 3))
+        arr = np.random.random(100) + 0.5
+        for op, iop in [
+            (lambda a, b: a + b, Points.__iadd__),
+            (lambda a, b: a - b, Points.__isub__),
+            (lambda a, b: a * b, Points.__imul__),
+            (lambda a, b: a / b, Points.__itruediv__),
+        ]:
+            for other in [Points(np.random.random((100, 3))), Point(1, 2, 3), 2.0, arr]:
+                pnts = Points(data.copy())
+                result = iop(pnts, other)
+                if result is NotImplemented:
+                    continue
+                expected = op(Points(data.copy()), other)
+                self.assertIs(result, pnts)
+                np.testing.assert_array_equal(pnts.data, expected.data)
+
     def test_trigs(self):
         np.testing.assert_array_equal(
             self.pnts.sines().data,
@@ -184,4 +222,100 @@ class TestPoints(unittest.TestCase):
         np.testing.assert_array_almost_equal(
             vels.data, 
             np.tile([step0 / dt, 2 * step0 / dt, -1 * step0 / dt], (100, 1))
-        )
\ No newline at end of file
+        )
+
+    def test_to_rotation_matrix(self):
+        pnts = Points(np.random.random((100, 3)))
+        np.testing.assert_array_almost_equal(
+            pnts.to_rotation_matrix(),
+            np.array([Point(*p).to_rotation_matrix() for p in pnts.data])
+        )
+
+    def test_remove_outliers(self):
+        data = np.tile([1.0, 0, 0], (100, 1)) + np.random.random((100, 3)) * 0.01
+        data[50] = [100, 0, 0]
+        data[70] = [np.nan, np.nan, np.nan]
+        pnts = Points(data)
+
+        cleaned = pnts.remove_outliers(2)
+        self.assertIsNot(cleaned.data, pnts.data)
+        np.testing.assert_array_equal(cleaned.data[50], data[49])
+        np.testing.assert_array_equal(cleaned.data[70], data[69])
+        np.testing.assert_array_equal(cleaned.data[:50], data[:50])
+
+    def test_fill_outliers(self):
+        data = np.tile([1.0, 0, 0], (100, 1)) + \
+            np.random.default_rng(0).random((100, 3)) * 0.01
+        data[0] = [100, 0, 0]
+        data[30] = [np.nan, np.nan, np.nan]
+        data[60] = [2, 0, 0]
+        original = data.copy()
+
+        for strategy, nstds, replaced in [
+                ('hold', 3, [30]), ('sigma', 3, [0, 30]), ('mad', 10, [0, 30, 60])]:
+            pnts = Points(original.copy())
+            mask = pnts.fill_outliers(nstds, strategy, 11)
+            np.testing.assert_array_equal(np.nonzero(mask)[0], replaced, err_msg=strategy)
+            np.testing.assert_array_equal(pnts.data[30], original[29])
+
+        self.assertTrue(np.all(np.isnan(pnts.data[0])))
+
+        with self.assertRaises(ValueError):
+            Points(original).fill_outliers(strategy='unknown')
+
+    def test_rolling_outlier_filter(self):
+        rng = np.random.default_rng(0)
+        data = np.tile([1.0, 0, 0], (200, 1)) + rng.random((200, 3)) * 0.01
+        for i, factor in [(100, 50), (103, 20), (113, 10)]:
+            data[i] *= factor
+        filt = RollingOutlierFilter(2, 50)
+        filtered = np.vstack([filt(Points(data[i:i + 30])).data for i in range(0, 200, 30)])
+        np.testing.assert_array_equal(np.nonzero(np.any(filtered != data, axis=1))[0], [100, 103, 113])
+        np.testing.assert_array_equal(filtered[113], data[112])
+
+    def test_predicates(self):
+        rng = np.random.default_rng(1)
+        data = np.vstack([
+            rng.random((20, 3)) - 0.5,
+            [[1, 0, 0], [-1, 0, 0], [0, 1, 0], [0, 0, 2], [0, 0, 0]]
+        ])
+        p1, p2 = Points(data), Points(np.vstack([data[5:], data[:5]]))
+        ref = Point(1, 0, 0)
+        np.testing.assert_array_equal(is_zero(p1), np.arange(25) == 24)
+
+        def scalar(func, a, b, default):
+            out = []
+            for x, y in zip(a, b):
+                try:
+                    out.append(func(Point(*x), Point(*y)))
+                except ValueError:
+                    out.append(default)
+            return np.array(out)
+
+        for func, default in [
+            (pt.cos_angle_between, np.nan), (pt.angle_between, np.nan),
+            (pt.min_angle_between, np.nan), (pt.scalar_projection, 0)
+        ]:
+            np.testing.assert_array_almost_equal(
+                func(p1, p2), scalar(func, p1.data, p2.data, default), err_msg=func.__name__)
+            np.testing.assert_array_almost_equal(
+                func(p1, ref), scalar(func, p1.data, [list(ref)] * 25, default), err_msg=func.__name__)
+
+        for func in [pt.is_parallel, pt.is_anti_parallel, pt.is_perpendicular]:
+            np.testing.assert_array_equal(
+                func(p1, ref), scalar(func, p1.data, [list(ref)] * 25, False), err_msg=func.__name__)
+            np.testing.assert_array_equal(
+                func(p1, p2), scalar(func, p1.data, p2.data, False), err_msg=func.__name__)
+
+        np.testing.assert_array_almost_equal(
+            pt.vector_projection(p1, ref).data,
+            np.array([list(pt.vector_projection(Point(*x), ref)) for x in p1.data]))
+
+        perp = pt.arbitrary_perpendicular(p1)
+        np.testing.assert_array_almost_equal(abs(perp), np.ones(25))
+        np.testing.assert_array_almost_equal(p1.dot(perp), np.zeros(25))
+        self.assertIsInstance(pt.arbitrary_perpendicular(Point(1, 2, 3)), Point)
+
+        with self.assertRaises(ValueError):
+            pt.raisezero(p1)
+        pt.raisezero(Points(data[:20]))
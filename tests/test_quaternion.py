@@ -1,5 +1,5 @@
 import unittest
-from geometry import Quaternion, Point
+from geometry import Quaternion, Point, dot_product, cross_product
 from math import pi
 import numpy as np
 
@@ -129,3 +129,14 @@ class TestQuaternion(unittest.TestCase):
         )(*pnts.T))
         print(quats.T)
         self.assertNotEqual(abs(Quaternion(*quats.T[1])), 0)
+
+    def test_mul(self):
+        q1 = Quaternion(1, 2, 3, 4)
+        q2 = Quaternion(-0.5, 0.1, 0.7, -2)
+        w = q1.w * q2.w - dot_product(q1.axis, q2.axis)
+        xyz = q1.w * q2.axis + q2.w * q1.axis + cross_product(q1.axis, q2.axis)
+        self.assertEqual(list(q1 * q2), [w] + list(xyz))
+
+    def test_slots(self):
+        with self.assertRaises(AttributeError):
+            Quaternion(1, 0, 0, 0).a = 1
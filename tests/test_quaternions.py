@@ -4,6 +4,7 @@ import numpy as np
 from geometry.quaternion import Quaternion
 from geometry.points import Points
 from geometry.point import Point
+from geometry.parallel import ChunkExecutor
 
 
 class TestQuaternions(unittest.TestCase):
@@ -45,6 +46,50 @@ class TestQuaternions(unittest.TestCase):
             )(*self.qs.data.T)).T
         )
 
+    def test_inplace(self):
+        q1 = Quaternions(np.random.random((100, 4))).norm()
+        q2 = Quaternions(np.random.random((100, 4))).norm()
+        expected = (q1 * q2).data
+        q = Quaternions(q1.data.copy())
+        q *= q2
+        np.testing.assert_array_almost_equal(q.data, expected)
+
+        q = Quaternions(q1.data.copy())
+        q *= Quaternion(*q2.data[0])
+        np.testing.assert_array_almost_equal(q.data, (q1 * Quaternion(*q2.data[0])).data)
+
+        q = Quaternions(q1.data.copy())
+        q /= 2.0
+        np.testing.assert_array_equal(q.data, q1.data / 2.0)
+
+        q = Quaternions(q1.data.copy() * 3)
+        self.assertIs(q.normalize_(), q)
+        np.testing.assert_array_equal(q.data, Quaternions(q1.data * 3).norm().data)
+
+        q = Quaternions(q1.data.copy())
+        self.assertIs(q.conjugate_(), q)
+        np.testing.assert_array_equal(q.data, q1.conjugate().data)
+
+    def test_out(self):
+        out = Quaternions(np.empty((2, 4)))
+        self.assertIs(self.qs.norm(out), out)
+        np.testing.assert_array_equal(out.data, self.qs.norm().data)
+        self.assertIs(self.qs.conjugate(out), out)
+        np.testing.assert_array_equal(out.data, self.qs.conjugate().data)
+        self.assertIs(self.qs.inverse(out), out)
+        np.testing.assert_array_equal(out.data, self.qs.inverse().data)
+
+    def test_mul_broadcast(self):
+        q1 = Quaternions(np.random.random((100, 4))).norm()
+        q2 = Quaternions(np.random.random((1, 4))).norm()
+        tiled = Quaternions(np.tile(q2.data, (100, 1)))
+        np.testing.assert_array_equal((q1 * q2).data, (q1 * tiled).data)
+        np.testing.assert_array_equal((q2 * q1).data, (tiled * q1).data)
+        np.testing.assert_array_equal(
+            (q1 * Quaternion(*q2.data[0])).data, (q1 * tiled).data)
+        np.testing.assert_array_equal(
+            (Quaternion(*q2.data[0]) * q1).data, (tiled * q1).data)
+
     def test_mul(self):
         q1 = Quaternions(np.random.random((100, 4))).norm()
         q2 = Quaternions(np.random.random((100, 4))).norm()
@@ -95,7 +140,7 @@ class TestQuaternions(unittest.TestCase):
         )
 
     def test_transform_point(self):
-        np.testing.assert_array_equal(
+        np.testing.assert_array_almost_equal(
             self.qs.transform_point(Point(1, 1, 1)).data,
             np.array(np.vectorize(
                 lambda *args: tuple(Quaternion(*
@@ -103,6 +148,23 @@ class TestQuaternions(unittest.TestCase):
             )(*self.qs.data.T)).T
         )
 
+    def test_transform_points(self):
+        qs = Quaternions(np.random.random((100, 4))).norm()
+        pnts = Points(np.random.random((100, 3)))
+
+        expected = np.array(np.vectorize(
+            lambda *args: tuple(Quaternion(*args[:4]).transform_point(Point(*args[4:])))
+        )(*np.column_stack([qs.data, pnts.data]).T)).T
+
+        np.testing.assert_array_almost_equal(qs.transform_point(pnts).data, expected)
+
+        out = Points(np.empty((100, 3)))
+        self.assertIs(qs.transform_point(pnts, out), out)
+        np.testing.assert_array_almost_equal(out.data, expected)
+
+        qs.transform_point(pnts, pnts)
+        np.testing.assert_array_almost_equal(pnts.data, expected)
+
     def test_from_axis_angle(self):
         points = Points(np.random.random((100, 3)))
 
@@ -133,3 +195,183 @@ class TestQuaternions(unittest.TestCase):
                 lambda *args: tuple(Quaternion(*args).to_axis_angle())
             )(*qs.data.T)).T
         )
+
+    def test_to_axis_angle_robust(self):
+        angles = Points(np.array([
+            [0, 0, 0], [1e-9, 0, 0], [0, 1e-6, 0], [0, 0, 0.1], [np.pi - 1e-3, 0, 0]]))
+        qs = Quaternions.exp(angles * 0.5)
+        np.testing.assert_allclose(qs.to_axis_angle().data, angles.data, rtol=1e-12, atol=0)
+        # the other hemisphere is the same rotation
+        np.testing.assert_allclose((qs * -1.0).to_axis_angle().data, angles.data, rtol=1e-12, atol=0)
+        self.assertFalse(np.any(np.isnan(Quaternions(np.array([[1.0, 0, 0, 0]])).to_axis_angle().data)))
+
+    def test_log_exp(self):
+        qs = Quaternions(np.random.random((100, 4)) - 0.5).norm()
+        qs = qs * np.where(qs.w < 0, -1.0, 1.0)
+        np.testing.assert_array_almost_equal(Quaternions.exp(qs.log()).data, qs.data)
+
+    def test_diff_phase_jump(self):
+        qs = Quaternions.from_euler(Points(np.column_stack([
+            np.linspace(0, 1, 50), np.zeros(50), np.zeros(50)])))
+        flipped = Quaternions(qs.data.copy())
+        flipped.data[::2] *= -1
+        np.testing.assert_array_almost_equal(flipped.diff(0.1).data, qs.diff(0.1).data)
+        np.testing.assert_array_almost_equal(qs.body_diff(0.1).x, np.full(50, 1 / 49 / 0.1))
+
+    def test_to_euler(self):
+        qs = Quaternions(np.random.random((100, 4)) - 0.5).norm()
+        np.testing.assert_array_almost_equal(
+            qs.to_euler().data,
+            np.array(np.vectorize(
+                lambda *args: tuple(Quaternion(*args).to_euler())
+            )(*qs.data.T)).T
+        )
+        np.testing.assert_array_almost_equal(qs.to_euler('ZYX').data, qs.to_euler().data[:, ::-1])
+
+        eul = Points((np.random.random((100, 3)) - 0.5) * np.array([6, 3, 6]))
+        np.testing.assert_array_almost_equal(Quaternions.from_euler(eul).to_euler().data, eul.data)
+
+    def test_to_euler_sequences(self):
+        qs = Quaternions(np.random.random((100, 4)) - 0.5).norm()
+        axes = {'x': Point(1, 0, 0), 'y': Point(0, 1, 0), 'z': Point(0, 0, 1)}
+        for seq in ['xyz', 'zxy', 'xyx', 'zyz', 'XYZ', 'YZX', 'ZXZ', 'YXY']:
+            angles = qs.to_euler(seq).data
+            rots = [Quaternions.from_axis_angle(Points(angles[:, i:i + 1] * np.array([list(axes[ax])])))
+                    for i, ax in enumerate(seq.lower())]
+            q = rots[2] * rots[1] * rots[0] if seq.islower() else rots[0] * rots[1] * rots[2]
+            np.testing.assert_array_almost_equal(
+                np.abs(np.einsum('ij,ij->i', q.data, qs.data)), np.ones(100), err_msg=seq)
+
+    def test_to_euler_gimbal(self):
+        eul = Points(np.array([[0.3, np.pi / 2, 0.2], [0.3, -np.pi / 2, 0.1]]))
+        qs = Quaternions.from_euler(eul)
+        angles = qs.to_euler()
+        self.assertFalse(np.any(np.isnan(angles.data)))
+        np.testing.assert_array_equal(angles.z, np.zeros(2))
+        np.testing.assert_array_almost_equal(
+            np.abs(np.einsum('ij,ij->i', Quaternions.from_euler(angles).data, qs.data)), np.ones(2))
+
+    def test_to_euler_unwrap(self):
+        yaw = np.linspace(0, 6 * np.pi, 200)
+        qs = Quaternions.from_euler(Points(np.column_stack([np.zeros(200), np.zeros(200), yaw])))
+        self.assertGreater(np.max(np.abs(np.diff(qs.to_euler().z))), 6)
+        np.testing.assert_array_almost_equal(qs.to_euler(unwrap=True).z, yaw)
+
+    def test_to_euler_bad_sequence(self):
+        for seq in ['xy', 'xxy', 'xYz', 'abc']:
+            with self.assertRaises(ValueError):
+                self.qs.to_euler(seq)
+
+    def test_to_rotation_matrix(self):
+        qs = Quaternions(np.random.random((100, 4)) - 0.5).norm()
+        np.testing.assert_array_almost_equal(
+            qs.to_rotation_matrix(),
+            np.array([Quaternion(*q).to_rotation_matrix() for q in qs.data])
+        )
+
+    def test_from_rotation_matrix(self):
+        # enough random attitudes to cover all four Shepperd cases
+        rmats = Quaternions(np.random.random((1000, 4)) - 0.5).norm().to_rotation_matrix()
+
+        np.testing.assert_array_almost_equal(
+            Quaternions.from_rotation_matrix(rmats).data,
+            np.array([list(Quaternion.from_rotation_matrix(rmat)) for rmat in rmats])
+        )
+
+        np.testing.assert_array_almost_equal(
+            Quaternions.from_rotation_matrix(rmats).to_rotation_matrix(),
+            rmats
+        )
+
+    def test_stream_diff(self):
+        qs = Quaternions.from_euler(Points(np.cumsum(np.random.random((100, 3)) * 0.1, axis=0)))
+        dt = np.full(100, 0.1)
+        chunks = [(Quaternions(qs.data[i:i + 30]), dt[i:i + 30]) for i in range(0, 100, 30)]
+        rates = list(Quaternions.stream_diff(iter(chunks)))
+        np.testing.assert_array_equal(
+            np.vstack([r.data for r in rates]), qs.diff(dt).data)
+
+    def test_stream_body_diff_outliers(self):
+        qs = Quaternions.from_euler(Points(np.column_stack([
+            np.linspace(0, 1, 200), np.zeros(200), np.zeros(200)])))
+        qs.data[100] = Quaternion.from_euler(Point(1, 1, 1)).to_list()
+
+        rates = np.vstack([r.data for r in Quaternions.stream_body_diff(
+            ((Quaternions(qs.data[i:i + 50]), 0.1) for i in range(0, 200, 50)),
+            nstds=2, window=50
+        )])
+        self.assertEqual(len(rates), 200)
+        self.assertFalse(np.any(np.isnan(rates)))
+        np.testing.assert_array_almost_equal(rates[99:101], rates[98:99].repeat(2, axis=0))
+
+    def test_cumprod(self):
+        qs = Quaternions(np.random.random((100, 4)) - 0.5).norm()
+        resets = np.array([0, 7, 8, 40, 99])
+        for right in [True, False]:
+            for reset in [None, resets]:
+                expected = [Quaternion(*qs.data[0])]
+                for i in range(1, 100):
+                    q = Quaternion(*qs.data[i])
+                    if reset is not None and i in reset:
+                        expected.append(q)
+                    else:
+                        expected.append(expected[-1] * q if right else q * expected[-1])
+                np.testing.assert_array_almost_equal(
+                    qs.cumprod(right, reset).data, np.array([list(q) for q in expected]))
+                with ChunkExecutor(3, min_chunk=10) as executor:
+                    np.testing.assert_array_almost_equal(
+                        qs.cumprod(right, reset, executor=executor).data,
+                        np.array([list(q) for q in expected]))
+
+    def test_cumprod_normalize(self):
+        qs = Quaternions.from_axis_angle(Points(np.random.random((10000, 3)) * 0.01))
+        out = qs.cumprod(normalize=True)
+        np.testing.assert_array_almost_equal(abs(out), np.ones(10000), 14)
+        np.testing.assert_array_almost_equal(
+            np.abs(np.einsum('ij,ij->i', out.data, qs.cumprod().data)), np.ones(10000))
+
+    def test_continuous(self):
+        qs = Quaternions.from_euler(Points(np.column_stack([
+            np.zeros(20), np.zeros(20), np.linspace(0, 6 * np.pi, 20)])))
+        qs.data[::3] *= -1
+        dots = np.einsum('ij,ij->i', qs.continuous().data[:-1], qs.continuous().data[1:])
+        self.assertTrue(np.all(dots > 0))
+
+    def test_resample_slerp(self):
+        t = np.array([0, 1, 2])
+        qs = Quaternions.from_euler(Points(np.array([
+            [0, 0, 0], [0, 0, np.pi / 2], [0, 0, np.pi]])))
+
+        resampled = qs.resample(t, np.array([0, 0.5, 1, 1.25, 3]))
+        np.testing.assert_array_almost_equal(
+            resampled.data,
+            Quaternions.from_euler(Points(np.array([
+                [0, 0, 0], [0, 0, np.pi / 4], [0, 0, np.pi / 2],
+                [0, 0, 5 * np.pi / 8], [0, 0, np.pi]]))).data
+        )
+
+    def test_resample_sign_flip(self):
+        t = np.arange(2)
+        qs = Quaternions.from_euler(Points(np.array([[0, 0, 0], [0, 0, np.pi / 2]])))
+        flipped = Quaternions(qs.data * np.array([[1], [-1]]))
+        np.testing.assert_array_almost_equal(
+            qs.resample(t, np.linspace(0, 1, 5)).data,
+            flipped.resample(t, np.linspace(0, 1, 5)).data
+        )
+
+    def test_resample_squad(self):
+        t = np.linspace(0, 10, 11)
+        t_dst = np.linspace(0, 10, 101)
+        # a constant rate rotation, so squad and slerp agree
+        qs = Quaternions.from_euler(Points(np.column_stack([
+            np.zeros(11), np.zeros(11), t * 0.3])))
+        np.testing.assert_array_almost_equal(
+            qs.resample(t, t_dst, 'squad').data,
+            qs.resample(t, t_dst, 'slerp').data
+        )
+
+        qs = Quaternions(np.random.random((11, 4)) - 0.5).norm()
+        squad = qs.resample(t, t_dst, 'squad')
+        np.testing.assert_array_almost_equal(abs(squad), np.ones(101))
+        np.testing.assert_array_almost_equal(
+            abs(np.einsum('ij,ij->i', squad.data[::10], qs.data)), np.ones(11))
@@ -0,0 +1,75 @@
+import unittest
+from unittest import mock
+from geometry import spatial, pairwise
+from geometry import SpatialIndex, Points, Point
+import numpy as np
+
+
+class TestSpatialIndex(unittest.TestCase):
+    def setUp(self):
+        rng = np.random.default_rng(1)
+        self.pnts = Points(rng.random((2000, 3)) * 100)
+        # a helix, most cells of the bounding box are empty
+        t = np.linspace(0, 20, 3000)
+        self.path = Points(np.column_stack([np.cos(t) * 50, np.sin(t) * 50, t * 10]))
+        self.queries = Points(rng.random((200, 3)) * 120 - 10)
+
+    def brute(self, pnts, queries):
+        return np.linalg.norm(pnts.data[np.newaxis] - queries.data[:, np.newaxis], axis=2)
+
+    def test_query(self):
+        for pnts in [self.pnts, self.path]:
+            index = SpatialIndex(pnts)
+            dists, idxs = index.query(self.queries, k=5)
+            expected = self.brute(pnts, self.queries)
+            np.testing.assert_array_almost_equal(dists, np.sort(expected, axis=1)[:, :5])
+            np.testing.assert_array_almost_equal(
+                np.take_along_axis(expected, idxs, axis=1), dists)
+
+    def test_query_point(self):
+        index = SpatialIndex(self.pnts, 10)
+        dists, idxs = index.query(Point(1000, 1000, 1000), k=1)
+        self.assertEqual(idxs[0, 0], np.argmin(abs(self.pnts - Point(1000, 1000, 1000))))
+
+    def test_query_more_than_count(self):
+        index = SpatialIndex(Points(self.pnts.data[:3]))
+        dists, idxs = index.query(self.queries, k=5)
+        self.assertTrue(np.all(idxs[:, 3:] == -1))
+        self.assertTrue(np.all(np.isinf(dists[:, 3:])))
+        self.assertTrue(np.all(idxs[:, :3] >= 0))
+
+    def test_query_radius(self):
+        for pnts, cell_size in [(self.pnts, None), (self.path, None), (self.pnts, 100)]:
+            index = SpatialIndex(pnts, cell_size)
+            qidx, pidx, dist = index.query_radius(self.queries, 8, chunk=50)
+            expected = self.brute(pnts, self.queries)
+            eq, ep = np.nonzero(expected <= 8)
+            self.assertEqual(
+                sorted(zip(qidx.tolist(), pidx.tolist())),
+                sorted(zip(eq.tolist(), ep.tolist())))
+            np.testing.assert_array_almost_equal(dist, expected[qidx, pidx])
+
+    def test_offset_queries(self):
+        # queries off a sparse path search many empty cells, a few at a time
+        index = SpatialIndex(self.path)
+        far = Points(self.path.data[::10] + np.array([300.0, 0, 0]))
+        near = Points(self.path.data[::10] + np.array([10.0, 0, 0]))
+        with mock.patch.object(spatial, '_CELL_BUDGET', 1000):
+            dists, idxs = index.query(far, k=3)
+            qidx, pidx, dist = index.query_radius(near, 12)
+        np.testing.assert_array_almost_equal(dists, np.sort(self.brute(self.path, far), axis=1)[:, :3])
+        eq, ep = np.nonzero(self.brute(self.path, near) <= 12)
+        self.assertEqual(
+            sorted(zip(qidx.tolist(), pidx.tolist())),
+            sorted(zip(eq.tolist(), ep.tolist())))
+
+    def test_query_radius_brute_tiled(self):
+        index = SpatialIndex(self.path)
+        far = Points(self.path.data[::10] + np.array([300.0, 0, 0]))
+        with mock.patch.object(pairwise, 'TILE_BYTES', 4096):
+            qidx, pidx, dist = index.query_radius(far, 320)
+        expected = self.brute(self.path, far)
+        eq, ep = np.nonzero(expected <= 320)
+        self.assertEqual(list(zip(qidx.tolist(), pidx.tolist())), sorted(
+            zip(eq.tolist(), ep.tolist()), key=lambda qp: (qp[0], expected[qp])))
+        np.testing.assert_array_almost_equal(dist, expected[qidx, pidx])
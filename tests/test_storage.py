@@ -0,0 +1,48 @@
+import unittest
+import os
+import tempfile
+from geometry import Points, Quaternions, storage
+import numpy as np
+
+
+class TestStorage(unittest.TestCase):
+    def setUp(self):
+        self.dir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.dir.name, 'flight.npy')
+        self.t = np.linspace(0, 99, 100)
+        self.pos = Points(np.random.random((100, 3)))
+        self.att = Quaternions(np.random.random((100, 4)).astype(np.float32))
+
+    def tearDown(self):
+        self.dir.cleanup()
+
+    def test_points_npy(self):
+        self.pos.to_npy(self.path)
+        pnts = Points.from_npy(self.path)
+        self.assertIsInstance(pnts.data, np.memmap)
+        np.testing.assert_array_equal(pnts.data, self.pos.data)
+
+    def test_quaternions_npy(self):
+        self.att.to_npy(self.path)
+        np.testing.assert_array_equal(Quaternions.from_npy(self.path).data, self.att.data)
+
+    def test_bundle(self):
+        storage.save(self.path, self.t, pos=self.pos, att=self.att, throttle=np.ones(100))
+        bundle = storage.load(self.path)
+
+        np.testing.assert_array_equal(bundle['t'], self.t)
+        self.assertIsInstance(bundle['pos'], Points)
+        np.testing.assert_array_equal(bundle['pos'].data, self.pos.data)
+        self.assertIsInstance(bundle['att'], Quaternions)
+        self.assertEqual(bundle['att'].data.dtype, np.float32)
+        np.testing.assert_array_equal(bundle['throttle'], np.ones(100))
+
+    def test_window(self):
+        storage.save(self.path, self.t, pos=self.pos)
+        bundle = storage.load(self.path, 10, 20)
+        np.testing.assert_array_equal(bundle['t'], self.t[10:20])
+        np.testing.assert_array_equal(bundle['pos'].data, self.pos.data[10:20])
+
+    def test_length_mismatch(self):
+        with self.assertRaises(ValueError):
+            storage.save(self.path, self.t, pos=Points(np.random.random((10, 3))))
@@ -0,0 +1,69 @@
+import unittest
+import os
+import tempfile
+from geometry import Trajectory, Points, Quaternions
+import numpy as np
+
+
+class TestTrajectory(unittest.TestCase):
+    def setUp(self):
+        self.t = np.linspace(0, 9.9, 100)
+        self.traj = Trajectory(
+            self.t,
+            Points(np.column_stack([self.t * 2, self.t ** 2, np.zeros(100)])),
+            Quaternions.from_euler(Points(np.column_stack([
+                self.t * 0.1, np.zeros(100), np.zeros(100)])))
+        )
+
+    def test_length_mismatch(self):
+        with self.assertRaises(ValueError):
+            Trajectory(self.t[:10], self.traj.pos)
+
+    def test_derived(self):
+        np.testing.assert_array_almost_equal(self.traj.vel.x, np.full(100, 2))
+        np.testing.assert_array_almost_equal(self.traj.acc.y[2:-2], np.full(96, 2))
+        np.testing.assert_array_almost_equal(self.traj.body_rates.x[:-1], np.full(99, 0.1))
+        self.assertIs(self.traj.vel, self.traj.vel)
+
+    def test_jittered_rates(self):
+        t = np.cumsum(np.random.default_rng(0).uniform(0.05, 0.15, 100))
+        traj = Trajectory(
+            t,
+            Points(np.column_stack([t * 2, np.zeros(100), np.zeros(100)])),
+            Quaternions.from_euler(Points(np.column_stack([
+                t * 0.1, np.zeros(100), np.zeros(100)])))
+        )
+        np.testing.assert_array_almost_equal(traj.body_rates.x, np.full(100, 0.1))
+        np.testing.assert_array_almost_equal(traj.rates.x, np.full(100, 0.1))
+        np.testing.assert_array_almost_equal(traj.vel.x, np.full(100, 2))
+
+    def test_window(self):
+        window = self.traj.window(2, 4)
+        np.testing.assert_array_equal(window.t, self.t[20:40])
+        self.assertTrue(np.shares_memory(window.pos.data, self.traj.pos.data))
+        self.assertTrue(np.shares_memory(window.att.data, self.traj.att.data))
+
+    def test_window_keeps_derived(self):
+        vel = self.traj.vel
+        window = self.traj.window(2, 4)
+        self.assertTrue(np.shares_memory(window.vel.data, vel.data))
+        self.assertNotIn('acc', window.__dict__)
+
+    def test_window_independent_of_access(self):
+        fresh = self.traj.window(2, 4)
+        vel, body_rates = fresh.vel.data.copy(), fresh.body_rates.data.copy()
+        self.traj.vel, self.traj.body_rates
+        window = self.traj.window(2, 4)
+        np.testing.assert_array_equal(window.vel.data, vel)
+        np.testing.assert_array_equal(window.body_rates.data, body_rates)
+        np.testing.assert_array_equal(vel, self.traj.vel.data[20:40])
+        np.testing.assert_array_equal(window[5:].acc.data, self.traj.acc.data[25:40])
+
+    def test_npy(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, 'traj.npy')
+            self.traj.to_npy(path)
+            window = Trajectory.from_npy(path, 2, 4)
+            np.testing.assert_array_equal(window.pos.data, self.traj.pos.data[20:40])
+            np.testing.assert_array_equal(window.att.data, self.traj.att.data[20:40])
+            del window
@@ -0,0 +1,77 @@
+import unittest
+from geometry import Coord, Coords, Transformation, Transformations, Point, Points, Quaternion, Quaternions
+import numpy as np
+
+
+class TestTransformations(unittest.TestCase):
+    def setUp(self):
+        self.transforms = Transformations(
+            Points(np.random.random((50, 3))),
+            Quaternions(np.random.random((50, 4)) - 0.5).norm()
+        )
+        self.pnts = Points(np.random.random((50, 3)))
+
+    def test_point(self):
+        np.testing.assert_array_almost_equal(
+            self.transforms.point(self.pnts).data,
+            np.array([list(self.transforms[i].point(Point(*p)))
+                      for i, p in enumerate(self.pnts.data)])
+        )
+
+    def test_single_transformation(self):
+        transform = self.transforms[0]
+        expected = np.array([list(transform.point(Point(*p))) for p in self.pnts.data])
+
+        np.testing.assert_array_almost_equal(transform.point(self.pnts).data, expected)
+        np.testing.assert_array_almost_equal(
+            Transformations.from_transformation(transform).point(self.pnts).data,
+            expected
+        )
+
+    def test_quat(self):
+        qs = Quaternions(np.random.random((50, 4)) - 0.5).norm()
+        np.testing.assert_array_almost_equal(
+            self.transforms.quat(qs).data,
+            np.array([list(self.transforms[i].quat(Quaternion(*q)))
+                      for i, q in enumerate(qs.data)])
+        )
+
+    def test_coord(self):
+        coords = self.transforms.coord()
+        for i in range(self.transforms.count):
+            coord = self.transforms[i].coord(Coord.from_nothing())
+            np.testing.assert_array_almost_equal(coords.origin.data[i], list(coord.origin))
+            np.testing.assert_array_almost_equal(
+                coords.rotation_matrix[i], coord.rotation_matrix)
+
+    def test_inverse(self):
+        np.testing.assert_array_almost_equal(
+            self.transforms.inverse().point(self.transforms.point(self.pnts)).data,
+            self.pnts.data
+        )
+
+    def test_compose(self):
+        other = Transformations(
+            Points(np.random.random((50, 3))),
+            Quaternions(np.random.random((50, 4)) - 0.5).norm()
+        )
+        np.testing.assert_array_almost_equal(
+            (self.transforms * other).point(self.pnts).data,
+            self.transforms.point(other.point(self.pnts)).data
+        )
+        np.testing.assert_array_almost_equal(
+            (self.transforms * other[0]).point(self.pnts).data,
+            self.transforms.point(other[0].point(self.pnts)).data
+        )
+
+    def test_from_coords(self):
+        ca = Coords.from_nothing(50)
+        cb = ca.translate(self.pnts).rotate(
+            self.transforms.rotation.to_rotation_matrix())
+        transforms = Transformations.from_coords(ca, cb)
+        for i in range(50):
+            transform = Transformation.from_coords(ca[i], cb[i])
+            np.testing.assert_array_almost_equal(
+                transforms.translation.data[i], list(transform.translation))
+            np.testing.assert_array_almost_equal(
+                transforms.rotation.data[i], list(transform.rotation))